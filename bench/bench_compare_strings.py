@@ -0,0 +1,52 @@
+"""Compare a reference against routing-table strings.
+
+Run with ``python bench/bench_compare_strings.py``.
+"""
+
+import timeit
+
+from rfc3986 import cache
+from rfc3986 import uri
+
+
+def legacy_eq(reference, other):
+    """The comparison used before strings were checked without parsing."""
+    other_ref = reference.from_string(other)
+    naive_equality = tuple(reference) == tuple(other_ref)
+    return naive_equality or reference.normalized_equality(other_ref)
+
+
+ROUTES = [f"https://api.example.com/v1/resource{i}?page=2" for i in range(50)]
+
+
+def run(name, reference, candidates, number):
+    for candidate in candidates:
+        assert (reference == candidate) == legacy_eq(reference, candidate)
+
+    def new():
+        for candidate in candidates:
+            reference == candidate
+
+    def old():
+        for candidate in candidates:
+            legacy_eq(reference, candidate)
+
+    timings = []
+    for func in (old, new):
+        best = min(timeit.repeat(func, number=number, repeat=5))
+        timings.append(best / number / len(candidates) * 1e6)
+    old_us, new_us = timings
+    print(
+        f"{name:10} old {old_us:7.2f} us  new {new_us:7.2f} us  "
+        f"{old_us / new_us:5.1f}x per comparison"
+    )
+
+
+if __name__ == "__main__":
+    reference = uri.URIReference.from_string(ROUTES[-1])
+    run("hit", reference, [ROUTES[-1]], 20000)
+    unnormalized = uri.URIReference.from_string(ROUTES[-1].upper())
+    run("normal", unnormalized, [unnormalized.normalize().unsplit()], 20000)
+    run("table", reference, ROUTES, 200)
+    cache.parse_cache.resize(4096)
+    run("table+lru", reference, ROUTES, 200)
@@ -0,0 +1,84 @@
+"""Compare encode_component with the byte-at-a-time implementation.
+
+Run with ``python bench/bench_encode_component.py``.
+"""
+
+import timeit
+
+from rfc3986 import compat
+from rfc3986 import misc
+from rfc3986 import normalizers
+
+PATHS = [
+    "/",
+    "/index.html",
+    "/api/v2/users/12345/repos",
+    "/static/js/app.0f3e1c9b.min.js",
+    "/wiki/Uniform_Resource_Identifier",
+    "/search/caf%C3%A9/results",
+    "/files/My Documents/report 2024.pdf",
+    "/wiki/Bücher",
+]
+QUERIES = [
+    "q=rfc3986",
+    "page=2&per_page=100&sort=updated",
+    "utm_source=newsletter&utm_medium=email&utm_campaign=spring_sale",
+    "redirect=https%3A%2F%2Fexample.com%2Fcallback%3Fstate%3Dabc",
+    "filter[name]=foo&filter[tags][]=a&filter[tags][]=b",
+    "q=hello world&lang=en",
+    "discount=100%&q=50%25",
+]
+
+
+def legacy_encode_component(uri_component, encoding):
+    """Return the output of encode_component as of rfc3986 2.0.0."""
+    if uri_component is None:
+        return uri_component
+
+    percent_encodings = len(
+        normalizers.PERCENT_MATCHER.findall(
+            compat.to_str(uri_component, encoding)
+        )
+    )
+
+    uri_bytes = compat.to_bytes(uri_component, encoding)
+    is_percent_encoded = percent_encodings == uri_bytes.count(b"%")
+
+    encoded_uri = bytearray()
+
+    for i in range(0, len(uri_bytes)):
+        byte = uri_bytes[i : i + 1]
+        byte_ord = ord(byte)
+        if (is_percent_encoded and byte == b"%") or (
+            byte_ord < 128 and byte.decode() in misc.NON_PCT_ENCODED
+        ):
+            encoded_uri.extend(byte)
+            continue
+        encoded_uri.extend(f"%{byte_ord:02x}".encode().upper())
+
+    return encoded_uri.decode(encoding)
+
+
+def run(name, corpus, number=20000):
+    for component in corpus:
+        assert normalizers.encode_component(
+            component, "utf-8"
+        ) == legacy_encode_component(component, "utf-8")
+
+    def encode_all(encode):
+        for component in corpus:
+            encode(component, "utf-8")
+
+    timings = []
+    for encode in (legacy_encode_component, normalizers.encode_component):
+        best = min(
+            timeit.repeat(lambda: encode_all(encode), number=number, repeat=5)
+        )
+        timings.append(best / number / len(corpus) * 1e9)
+    old, new = timings
+    print(f"{name:8} old {old:8.0f} ns  new {new:8.0f} ns  {old / new:5.1f}x")
+
+
+if __name__ == "__main__":
+    run("paths", PATHS)
+    run("queries", QUERIES)
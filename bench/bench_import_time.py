@@ -0,0 +1,50 @@
+"""Report how long importing rfc3986 and first using it take.
+
+Run with ``python bench/bench_import_time.py``. Each measurement is the best
+of several fresh interpreters.
+"""
+
+import subprocess
+import sys
+
+RUNS = 10
+
+FIRST_USE = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "import rfc3986\n"
+    "rfc3986.uri_reference('https://example.com/a/../b').normalize()\n"
+    "print(int((time.perf_counter() - start) * 1e6))\n"
+)
+
+
+def import_time():
+    """Return the cumulative ``-X importtime`` microseconds for rfc3986."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import rfc3986"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = [field.strip() for field in line.split("|")]
+        if fields[-1] == "rfc3986":
+            return int(fields[1])
+    raise RuntimeError("rfc3986 was not imported")
+
+
+def first_use_time():
+    result = subprocess.run(
+        [sys.executable, "-c", FIRST_USE],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout)
+
+
+if __name__ == "__main__":
+    imports = min(import_time() for _ in range(RUNS))
+    first_use = min(first_use_time() for _ in range(RUNS))
+    print(f"import rfc3986            {imports / 1000:7.1f} ms")
+    print(f"import and normalize one  {first_use / 1000:7.1f} ms")
@@ -0,0 +1,49 @@
+"""Compare checking IP literal hosts with the regular expressions.
+
+Run with ``python bench/bench_ip_literal.py``.
+"""
+
+import timeit
+
+from rfc3986 import _ip_literal
+from rfc3986 import misc
+
+AUTHORITIES = [
+    "[::1]",
+    "[::1]:8080",
+    "[2001:db8::8a2e:370:7334]:443",
+    "[2001:0db8:85a3:0000:0000:8a2e:0370:7334]",
+    "user@[fe80::1%25eth0]:80",
+    "[::ffff:192.0.2.128]",
+    "[2001:db8:0:0:0:0:0:1:2]",
+    "[v1.fe80::a+en1]",
+]
+
+
+def split_with_regex(authority):
+    match = misc.SUBAUTHORITY_MATCHER.match(authority)
+    return match and match.group("userinfo", "host", "port")
+
+
+def main(number=20000):
+    for authority in AUTHORITIES:
+        assert split_with_regex(authority) == _ip_literal.split_authority(
+            authority
+        )
+
+    timings = []
+    for split in (split_with_regex, _ip_literal.split_authority):
+        best = min(
+            timeit.repeat(
+                lambda: [split(a) for a in AUTHORITIES],
+                number=number,
+                repeat=5,
+            )
+        )
+        timings.append(best / number / len(AUTHORITIES) * 1e9)
+    old, new = timings
+    print(f"regex {old:6.0f} ns  scanner {new:6.0f} ns  {old / new:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compare IRIReference.encode with the uncached per-label version.
+
+Run with ``python bench/bench_iri_encode.py``.
+"""
+
+import random
+import timeit
+
+import idna
+
+from rfc3986 import compat
+from rfc3986 import exceptions
+from rfc3986 import iri
+from rfc3986 import uri
+
+HOSTS = 2000
+IRIS = 50000
+
+
+def legacy_encode(reference):
+    """The host encoding used before hosts were remembered."""
+
+    def idna_encoder(name):
+        if any(ord(c) > 128 for c in name):
+            try:
+                return idna.encode(name.lower(), strict=True, std3_rules=True)
+            except idna.IDNAError:
+                raise exceptions.InvalidAuthority(reference.authority)
+        return name
+
+    authority = ".".join(
+        compat.to_str(idna_encoder(part)) for part in reference.host.split(".")
+    )
+    return uri.URIReference(
+        reference.scheme,
+        authority,
+        reference.path,
+        reference.query,
+        reference.fragment,
+    )
+
+
+def make_corpus(idn_share):
+    rng = random.Random(3986)
+    labels = ["bücher", "straße", "пример", "例え", "δοκιμή", "café"]
+    hosts = []
+    for i in range(HOSTS):
+        if rng.random() < idn_share:
+            hosts.append(f"{rng.choice(labels)}{i}.example.com")
+        else:
+            hosts.append(f"www.site{i}.example.com")
+    return [
+        iri.IRIReference.from_string(f"https://{rng.choice(hosts)}/p?q=1")
+        for _ in range(IRIS)
+    ]
+
+
+def run(name, references):
+    for reference in references[:1000]:
+        assert reference.encode() == legacy_encode(reference)
+
+    timings = []
+    for func in (legacy_encode, iri.IRIReference.encode):
+        best = min(
+            timeit.repeat(
+                lambda: [func(reference) for reference in references],
+                number=1,
+                repeat=3,
+            )
+        )
+        timings.append(best / len(references) * 1e6)
+    old, new = timings
+    print(f"{name:10} old {old:7.2f} us  new {new:7.2f} us  {old / new:5.1f}x")
+
+
+if __name__ == "__main__":
+    for idn_share in (0.0, 0.3, 1.0):
+        run(f"{idn_share:.0%} IDN", make_corpus(idn_share))
@@ -0,0 +1,45 @@
+"""Compare iri_to_uri_many with encoding one IRIReference at a time.
+
+Run with ``python bench/bench_iri_to_uri_many.py``.
+"""
+
+import random
+import timeit
+
+from rfc3986 import batch
+from rfc3986.iri import IRIReference
+
+COUNT = 50000
+
+
+def make_iris():
+    rng = random.Random(3986)
+    hosts = [f"bücher{i}.example" for i in range(300)]
+    hosts += [f"www.site{i}.example.com" for i in range(700)]
+    return [
+        f"https://{rng.choice(hosts)}/straße/{i}?q=ü{i}#frag"
+        for i in range(COUNT)
+    ]
+
+
+def one_at_a_time(iris):
+    return [IRIReference.from_string(iri).encode().unsplit() for iri in iris]
+
+
+def main():
+    iris = make_iris()
+    assert list(batch.iri_to_uri_many(iris)) == one_at_a_time(iris)
+
+    def batched(iris):
+        return list(batch.iri_to_uri_many(iris))
+
+    timings = []
+    for func in (one_at_a_time, batched):
+        best = min(timeit.repeat(lambda: func(iris), number=1, repeat=3))
+        timings.append(best / COUNT * 1e6)
+    old, new = timings
+    print(f"old {old:6.2f} us/IRI  new {new:6.2f} us/IRI  {old / new:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
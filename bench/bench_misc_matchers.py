@@ -0,0 +1,53 @@
+"""Report import time and first-call latency for the misc matchers.
+
+Run with ``python bench/bench_misc_matchers.py``. Each measurement is the
+best of several fresh interpreters, since a matcher is only compiled once
+per process.
+"""
+
+import subprocess
+import sys
+
+RUNS = 10
+
+SETUP = "import rfc3986.api, rfc3986.misc\n"
+
+FIRST_CALLS = {
+    "import rfc3986.misc": ("", "import rfc3986.misc"),
+    "parse": (SETUP, "rfc3986.api.uri_reference('https://a.example/b')"),
+    "host": (SETUP, "rfc3986.api.uri_reference('https://a.example/b').host"),
+    "is_absolute": (
+        SETUP,
+        "rfc3986.api.uri_reference('https://a.example/b').is_absolute()",
+    ),
+    "is_valid_uri": (SETUP, "rfc3986.api.is_valid_uri('https://a.example/b')"),
+    "iri host": (
+        SETUP,
+        "rfc3986.api.iri_reference('https://a.example/\\u00fc').host",
+    ),
+}
+
+TEMPLATE = (
+    "{setup}"
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "{call}\n"
+    "print(int((time.perf_counter() - start) * 1e6))\n"
+)
+
+
+def first_call(setup, call):
+    code = TEMPLATE.format(setup=setup, call=call)
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(result.stdout)
+
+
+if __name__ == "__main__":
+    for name, (setup, call) in FIRST_CALLS.items():
+        best = min(first_call(setup, call) for _ in range(RUNS))
+        print(f"{name:20} {best / 1000:7.2f} ms")
@@ -0,0 +1,48 @@
+"""Show how normalize_many scales with the number of worker processes.
+
+Run with ``python bench/bench_normalize_many.py [COUNT]``.
+"""
+
+import os
+import sys
+import time
+
+import rfc3986
+
+TEMPLATES = [
+    "HTTP://Example.COM/a/./b/../c/{i}?Q=%2f&id={i}#%7efrag",
+    "https://user@cdn{i}.example.org:443/static/%7Eapp/{i}.js",
+    "http://[::1]:8080/api/v2/items/{i}/../{i}",
+    "mailto:User{i}@Example.COM",
+]
+
+
+def corpus(count):
+    for i in range(count):
+        yield TEMPLATES[i % len(TEMPLATES)].format(i=i)
+
+
+def main(count):
+    cpus = os.cpu_count() or 1
+    workers = 1
+    baseline = None
+    while True:
+        start = time.perf_counter()
+        for _ in rfc3986.normalize_many(
+            corpus(count), workers=workers, chunksize=2000
+        ):
+            pass
+        elapsed = time.perf_counter() - start
+        rate = count / elapsed
+        baseline = baseline or rate
+        print(
+            f"workers={workers:3d}  {rate:12,.0f} URIs/s"
+            f"  {rate / baseline:5.2f}x"
+        )
+        if workers >= cpus:
+            break
+        workers = min(workers * 2, cpus)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,50 @@
+"""Compare normalize_percent_characters with the findall/replace version.
+
+Run with ``python bench/bench_normalize_percent.py``.
+"""
+
+import timeit
+
+from rfc3986 import normalizers
+
+
+def legacy_normalize_percent_characters(s):
+    """The implementation used before the single substitution pass."""
+    matches = set(normalizers.PERCENT_MATCHER.findall(s))
+    for m in matches:
+        if not m.isupper():
+            s = s.replace(m, m.upper())
+    return s
+
+
+def make_path(escapes):
+    segments = [f"seg%{i % 256:02x}" for i in range(escapes)]
+    return "/static/" + "/".join(segments or ["index.html"])
+
+
+def make_query(escapes):
+    pairs = [f"k{i}=v%{(i * 7) % 256:02x}" for i in range(escapes)]
+    return "&".join(pairs or ["page=2", "sort=asc"])
+
+
+def run(name, component, number):
+    expected = legacy_normalize_percent_characters(component)
+    assert normalizers.normalize_percent_characters(component) == expected
+
+    timings = []
+    for func in (
+        legacy_normalize_percent_characters,
+        normalizers.normalize_percent_characters,
+    ):
+        best = min(
+            timeit.repeat(lambda: func(component), number=number, repeat=5)
+        )
+        timings.append(best / number * 1e6)
+    old, new = timings
+    print(f"{name:12} old {old:9.2f} us  new {new:9.2f} us  {old / new:6.1f}x")
+
+
+if __name__ == "__main__":
+    for escapes, number in ((0, 200000), (10, 20000), (1000, 200)):
+        run(f"path/{escapes}", make_path(escapes), number)
+        run(f"query/{escapes}", make_query(escapes), number)
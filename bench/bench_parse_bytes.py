@@ -0,0 +1,51 @@
+"""Compare parsing ASCII bytes natively with parsing them as text.
+
+Run with ``python bench/bench_parse_bytes.py``.
+"""
+
+import timeit
+
+from rfc3986 import parseresult
+
+REQUEST_TARGETS = [
+    b"http://example.com/",
+    b"http://api.example.com:8080/v1/users/42?fields=name,email",
+    b"https://user@cdn.example.net/static/app.js?v=3#main",
+    b"http://10.0.0.1/health",
+    b"http://example.com/search?q=caf%C3%A9&page=2",
+    b"http://example.com/a path/with spaces?x=<y>",
+]
+
+
+def parse_as_text(uri_bytes):
+    # Text input skips the bytes-native path but does the same work as the
+    # previous implementation did for bytes.
+    return parseresult.ParseResultBytes.from_string(uri_bytes.decode())
+
+
+def parse_natively(uri_bytes):
+    return parseresult.ParseResultBytes.from_string(uri_bytes)
+
+
+def main(number=20000):
+    for uri_bytes in REQUEST_TARGETS:
+        assert tuple(parse_as_text(uri_bytes)) == tuple(
+            parse_natively(uri_bytes)
+        )
+
+    timings = []
+    for parse in (parse_as_text, parse_natively):
+        best = min(
+            timeit.repeat(
+                lambda: [parse(u) for u in REQUEST_TARGETS],
+                number=number,
+                repeat=5,
+            )
+        )
+        timings.append(best / number / len(REQUEST_TARGETS) * 1e9)
+    old, new = timings
+    print(f"text {old:6.0f} ns  bytes {new:6.0f} ns  {old / new:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare parse_columns with building a ParseResult for every URL.
+
+Run with ``python bench/bench_parse_columns.py``.
+"""
+
+import collections
+import timeit
+
+from rfc3986 import batch
+from rfc3986 import exceptions
+from rfc3986.parseresult import ParseResult
+
+URLS = [
+    f"https://host{i % 50}.example.com:{8000 + i % 3}/api/v{i % 2}/items/{i}"
+    f"?page={i % 7}"
+    for i in range(10000)
+]
+
+
+def hosts_per_object():
+    counts = collections.Counter()
+    for url in URLS:
+        try:
+            counts[ParseResult.from_string(url).host] += 1
+        except exceptions.RFC3986Exception:
+            counts[None] += 1
+    return counts
+
+
+def hosts_per_column():
+    return collections.Counter(batch.parse_columns(URLS).host)
+
+
+def main():
+    assert hosts_per_object() == hosts_per_column()
+    timings = []
+    for func in (hosts_per_object, hosts_per_column):
+        best = min(timeit.repeat(func, number=5, repeat=5)) / 5
+        timings.append(best / len(URLS) * 1e9)
+    old, new = timings
+    print(f"ParseResult {old:6.0f} ns/URL  parse_columns {new:6.0f} ns/URL")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Compare the memory used per URL by URIReference and URIView.
+
+Run with ``python bench/bench_uri_view.py``.
+"""
+
+import tracemalloc
+
+from rfc3986.uri import URIReference
+from rfc3986.view import URIView
+
+COUNT = 100000
+
+
+def make_urls():
+    return [
+        f"https://host{i % 1000}.example.com/path/{i}/page.html?id={i}#top"
+        for i in range(COUNT)
+    ]
+
+
+def measure(parse, touch):
+    urls = make_urls()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    parsed = [parse(url) for url in urls]
+    if touch:
+        for ref in parsed:
+            ref.host
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # The input strings are kept alive by the caller in both cases.
+    del urls
+    return (after - before) / len(parsed)
+
+
+def main():
+    for touch in (False, True):
+        label = "after reading .host" if touch else "just parsed"
+        reference = measure(URIReference.from_string, touch)
+        view = measure(URIView.from_string, touch)
+        print(
+            f"{label:20} URIReference {reference:6.0f} B/URL  "
+            f"URIView {view:6.0f} B/URL"
+        )
+
+
+if __name__ == "__main__":
+    main()
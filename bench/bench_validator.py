@@ -0,0 +1,51 @@
+"""Compare Validator.validate with the function from Validator.compile.
+
+Run with ``python bench/bench_validator.py``.
+"""
+
+import timeit
+
+from rfc3986 import uri_reference
+from rfc3986 import validators
+
+URIS = [
+    uri_reference(u)
+    for u in (
+        "https://github.com/sigmavirus24/rfc3986",
+        "https://pypi.org/project/rfc3986/?q=1#files",
+        "https://user@github.com:443/python-hyper",
+        "https://[::1]:8443/",
+    )
+]
+
+VALIDATORS = {
+    "default": validators.Validator(),
+    "policy": validators.Validator()
+    .forbid_use_of_password()
+    .require_presence_of("scheme", "host")
+    .check_validity_of("scheme", "host", "port", "path")
+    .allow_schemes("https")
+    .allow_hosts("github.com", "pypi.org", "[::1]"),
+}
+
+
+def run(name, validator, number=20000):
+    def validate_all(validate):
+        for uri in URIS:
+            validate(uri)
+
+    timings = []
+    for validate in (validator.validate, validator.compile()):
+        best = min(
+            timeit.repeat(
+                lambda: validate_all(validate), number=number, repeat=5
+            )
+        )
+        timings.append(best / number / len(URIS) * 1e9)
+    old, new = timings
+    print(f"{name:8} validate {old:7.0f} ns  compiled {new:7.0f} ns")
+
+
+if __name__ == "__main__":
+    for name, validator in VALIDATORS.items():
+        run(name, validator)
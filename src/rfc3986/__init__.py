@@ -20,14 +20,22 @@ See http://rfc3986.readthedocs.io/ for detailed documentation.
 :license: Apache v2.0, see LICENSE for details
 """
 
-from .api import IRIReference
-from .api import URIReference
-from .api import iri_reference
-from .api import is_valid_uri
-from .api import normalize_uri
-from .api import uri_reference
-from .api import urlparse
-from .parseresult import ParseResult
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .api import IRIReference
+    from .api import URIReference
+    from .api import iri_reference
+    from .api import is_valid_uri
+    from .api import normalize_uri
+    from .api import parse_many
+    from .api import uri_reference
+    from .api import urlparse
+    from .batch import iri_to_uri_many
+    from .batch import normalize_many
+    from .parseresult import ParseResult
+    from .uri import CanonicalURI
 
 __title__ = "rfc3986"
 __author__ = "Ian Stapleton Cordasco"
@@ -39,9 +47,13 @@ __version__ = "2.0.0"
 __all__ = (
     "ParseResult",
     "URIReference",
+    "CanonicalURI",
     "IRIReference",
     "is_valid_uri",
     "normalize_uri",
+    "normalize_many",
+    "iri_to_uri_many",
+    "parse_many",
     "uri_reference",
     "iri_reference",
     "urlparse",
@@ -52,3 +64,60 @@ __all__ = (
     "__copyright__",
     "__version__",
 )
+
+# The names above are imported from their submodules the first time they are
+# used, so that importing rfc3986 alone stays cheap.
+_LAZY_NAMES = {
+    "IRIReference": "api",
+    "URIReference": "api",
+    "iri_reference": "api",
+    "is_valid_uri": "api",
+    "normalize_uri": "api",
+    "parse_many": "api",
+    "uri_reference": "api",
+    "urlparse": "api",
+    "iri_to_uri_many": "batch",
+    "normalize_many": "batch",
+    "ParseResult": "parseresult",
+    "CanonicalURI": "uri",
+}
+
+# Submodules that can be used as attributes of the package without being
+# imported first, as they could when the package imported them all.
+_SUBMODULES = frozenset(
+    [
+        "abnf_regexp",
+        "api",
+        "batch",
+        "builder",
+        "cache",
+        "compat",
+        "exceptions",
+        "iri",
+        "misc",
+        "normalizers",
+        "parseresult",
+        "stream",
+        "uri",
+        "validators",
+        "view",
+    ]
+)
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    try:
+        module_name = _LAZY_NAMES[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> t.List[str]:
+    return sorted(set(globals()) | set(_LAZY_NAMES) | _SUBMODULES)
@@ -0,0 +1,7 @@
+"""Run the rfc3986 command-line interface with ``python -m rfc3986``."""
+
+import sys
+
+from ._cli import main
+
+sys.exit(main())
@@ -0,0 +1,305 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Module containing the ``python -m rfc3986`` command-line interface.
+
+The functions that process chunks of lines live here rather than in
+``__main__`` so that worker processes can import them.
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import sys
+import time
+import typing as t
+
+from . import batch
+from . import exceptions
+from . import parseresult
+from . import stream
+from . import uri
+from . import validators
+
+# Each processed line becomes an (ok, text) pair. Text of lines that are not
+# ok is written to stderr and counted as an error.
+_Result = t.Tuple[bool, str]
+_ChunkFunc = t.Callable[[t.List[bytes], str], t.List[_Result]]
+
+_PARSE_ERRORS = (exceptions.RFC3986Exception, TypeError, ValueError)
+
+_SPLIT_FIELDS = parseresult.PARSED_COMPONENTS
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    """Run the command-line interface and return its exit status."""
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if args.chunksize < 1:
+        parser.error("--chunksize must be at least 1")
+
+    func: _ChunkFunc
+    if args.command == "normalize":
+        func = _normalize_chunk
+    elif args.command == "validate":
+        func = functools.partial(_validate_chunk, _validator_from(args))
+    elif args.command == "resolve":
+        try:
+            resolver = uri.URIReference.from_string(
+                args.base, args.encoding
+            ).resolver()
+        except exceptions.ResolutionError:
+            parser.error(f"base URI {args.base!r} has no scheme")
+        func = functools.partial(_resolve_chunk, resolver)
+    else:
+        func = functools.partial(_split_chunk, args.format)
+
+    return _run(func, args)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="rfc3986",
+        description="Process URIs, one per line, from files or stdin.",
+        epilog=(
+            "Lines that cannot be parsed are reported on stderr and make the "
+            "exit status 1. Throughput is reported on stderr at the end."
+        ),
+    )
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument(
+        "--encoding", default="utf-8", help="encoding of the input"
+    )
+    common.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of processes to use (default: %(default)s)",
+    )
+    common.add_argument(
+        "--chunksize",
+        type=int,
+        default=1000,
+        help="lines sent to a process at once (default: %(default)s)",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    normalize = subparsers.add_parser(
+        "normalize", parents=[common], help="normalize each URI"
+    )
+
+    validate = subparsers.add_parser(
+        "validate",
+        parents=[common],
+        help="check each URI, printing 'valid' or 'invalid' before it",
+    )
+    validate.add_argument(
+        "--allow-scheme",
+        action="append",
+        default=[],
+        help="permit this scheme (repeatable)",
+    )
+    validate.add_argument(
+        "--allow-host",
+        action="append",
+        default=[],
+        help="permit this host (repeatable)",
+    )
+    validate.add_argument(
+        "--allow-port",
+        action="append",
+        default=[],
+        help="permit this port (repeatable)",
+    )
+    validate.add_argument(
+        "--require",
+        action="append",
+        default=[],
+        choices=sorted(validators.Validator.COMPONENT_NAMES),
+        help="require this component to be present (repeatable)",
+    )
+    validate.add_argument(
+        "--forbid-password",
+        action="store_true",
+        help="reject URIs with a password in their userinfo",
+    )
+
+    resolve = subparsers.add_parser(
+        "resolve",
+        parents=[common],
+        help="resolve each reference against a base URI",
+    )
+    # An option rather than a positional argument, so that the files that
+    # follow it can be mixed with other options.
+    resolve.add_argument(
+        "--base", required=True, help="absolute URI to resolve against"
+    )
+
+    split = subparsers.add_parser(
+        "split",
+        parents=[common],
+        help="print the components of each URI",
+    )
+    split.add_argument(
+        "--format",
+        choices=("tsv", "jsonl"),
+        default="tsv",
+        help="output format (default: %(default)s)",
+    )
+
+    for subparser in (normalize, validate, resolve, split):
+        subparser.add_argument(
+            "files",
+            nargs="*",
+            default=["-"],
+            help="files to read, '-' for stdin (the default)",
+        )
+    return parser
+
+
+def _validator_from(args: argparse.Namespace) -> validators.Validator:
+    validator = (
+        validators.Validator()
+        .check_validity_of(*validators.Validator.COMPONENT_NAMES)
+        .allow_schemes(*args.allow_scheme)
+        .allow_hosts(*args.allow_host)
+        .allow_ports(*args.allow_port)
+        .require_presence_of(*args.require)
+    )
+    if args.forbid_password:
+        validator.forbid_use_of_password()
+    return validator
+
+
+def _run(func: _ChunkFunc, args: argparse.Namespace) -> int:
+    write = sys.stdout.write
+    lines = errors = 0
+    start = time.perf_counter()
+    results = batch._map_chunks(
+        func, _read_lines(args.files), args.jobs, args.chunksize, args.encoding
+    )
+    for ok, text in results:
+        lines += 1
+        if ok:
+            write(text + "\n")
+        else:
+            errors += 1
+            print(f"rfc3986: {text}", file=sys.stderr)
+    sys.stdout.flush()
+
+    elapsed = time.perf_counter() - start
+    rate = lines / elapsed if elapsed else 0.0
+    print(
+        f"rfc3986 {args.command}: {lines} lines, {errors} errors "
+        f"in {elapsed:.2f}s ({rate:.0f} lines/s)",
+        file=sys.stderr,
+    )
+    return 1 if errors else 0
+
+
+def _read_lines(files: t.Iterable[str]) -> t.Iterator[bytes]:
+    for name in files:
+        if name == "-":
+            source: stream._Source = sys.stdin.buffer
+        else:
+            source = name
+        with contextlib.ExitStack() as stack:
+            try:
+                lines, _ = stack.enter_context(stream._open_lines(source))
+            except OSError as error:
+                print(f"rfc3986: {error}", file=sys.stderr)
+                raise SystemExit(2)
+            for line, _ in lines:
+                yield t.cast(bytes, line)
+
+
+def _error(line: bytes, error: Exception) -> _Result:
+    return False, f"{line!r}: {error}"
+
+
+def _normalize_chunk(chunk: t.List[bytes], encoding: str) -> t.List[_Result]:
+    from_string = uri.URIReference.from_string
+    results: t.List[_Result] = []
+    for line in chunk:
+        try:
+            normalized = from_string(line, encoding).normalize().unsplit()
+        except _PARSE_ERRORS as error:
+            results.append(_error(line, error))
+        else:
+            results.append((True, normalized))
+    return results
+
+
+def _validate_chunk(
+    validator: validators.Validator,
+    chunk: t.List[bytes],
+    encoding: str,
+) -> t.List[_Result]:
+    validate = validator.compile()
+    from_string = uri.URIReference.from_string
+    results: t.List[_Result] = []
+    for line in chunk:
+        try:
+            reference = from_string(line, encoding)
+            validate(reference)
+        except exceptions.ValidationError as error:
+            text = reference.unsplit()
+            results.append((True, f"invalid\t{text}\t{error.args[0]}"))
+        except _PARSE_ERRORS as error:
+            results.append(_error(line, error))
+        else:
+            results.append((True, f"valid\t{reference.unsplit()}"))
+    return results
+
+
+def _resolve_chunk(
+    resolver: uri.Resolver,
+    chunk: t.List[bytes],
+    encoding: str,
+) -> t.List[_Result]:
+    from_string = uri.URIReference.from_string
+    results: t.List[_Result] = []
+    for line in chunk:
+        try:
+            resolved = resolver.resolve(from_string(line, encoding))
+        except _PARSE_ERRORS as error:
+            results.append(_error(line, error))
+        else:
+            results.append((True, resolved.unsplit()))
+    return results
+
+
+def _split_chunk(
+    output_format: str,
+    chunk: t.List[bytes],
+    encoding: str,
+) -> t.List[_Result]:
+    from_string = parseresult.ParseResult.from_string
+    results: t.List[_Result] = []
+    for line in chunk:
+        try:
+            components = from_string(line, encoding)
+        except _PARSE_ERRORS as error:
+            results.append(_error(line, error))
+            continue
+        if output_format == "jsonl":
+            text = json.dumps(dict(zip(_SPLIT_FIELDS, components)))
+        else:
+            text = "\t".join(
+                "" if value is None else str(value) for value in components
+            )
+        results.append((True, text))
+    return results
@@ -0,0 +1,174 @@
+"""Module containing a hand-written validator for IP literal hosts.
+
+This accepts the same strings as the IPv6 and IPvFuture parts of
+:data:`rfc3986.misc.SUBAUTHORITY_MATCHER`, :data:`rfc3986.misc.HOST_MATCHER`,
+:data:`rfc3986.misc.IPv6_MATCHER`, and
+:data:`rfc3986.misc.IPv6_NO_RFC4007_MATCHER`. Instead of trying the nine
+alternatives of :data:`rfc3986.abnf_regexp.IPv6_RE` one after the other, it
+reduces an address to its "shape", with each piece replaced by a single
+``x``, and looks that up among the few shapes an IPv6 address can have.
+
+Like the matchers, the functions that check a whole string accept a single
+trailing newline, because ``$`` matches just before one.
+"""
+
+import typing as t
+
+from . import abnf_regexp
+
+__all__ = ("is_ipv6_literal", "is_ip_literal", "split_authority")
+
+# Strings of allowed characters. "not text.strip(chars)" is true when every
+# character of text is in chars, without a loop in Python.
+_DIGITS = abnf_regexp.DIGIT
+_HEXDIGITS = abnf_regexp.DIGIT + "ABCDEFabcdef"
+# abnf_regexp.UNRESERVED_CHARS also has "!", but UNRESERVED_RE does not.
+_UNRESERVED = abnf_regexp.ALPHA + abnf_regexp.DIGIT + "._~-"
+_FUTURE_CHARS = _UNRESERVED + abnf_regexp.SUB_DELIMITERS + ":"
+_USERINFO_CHARS = _FUTURE_CHARS
+
+# Tables that replace each digit with an "x", and any "x" with a "?". Two
+# rounds of replacing "xx" with "x" then turn runs of one to four digits
+# into a single "x" and longer runs into at least "xx".
+_HEXDIGIT_SHAPES = bytes.maketrans(
+    _HEXDIGITS.encode("ascii") + b"x", b"x" * len(_HEXDIGITS) + b"?"
+)
+_DIGIT_SHAPES = bytes.maketrans(
+    _DIGITS.encode("ascii") + b"x", b"x" * len(_DIGITS) + b"?"
+)
+# The shape of every IPv6address made only of h16 pieces.
+_IPV6_SHAPES = frozenset(
+    [b":".join([b"x"] * 8)]
+    + [
+        b":".join([b"x"] * head) + b"::" + b":".join([b"x"] * tail)
+        for head in range(8)
+        for tail in range(8 - head)
+    ]
+)
+
+# The userinfo, host, and port of an authority.
+_Subauthority = t.Tuple[t.Optional[str], str, t.Optional[str]]
+
+
+def is_ipv6_literal(host: str, rfc4007: bool = True) -> bool:
+    """Check for a bracketed IPv6 address with an optional zone ID.
+
+    :param str host: The host to check, including its brackets.
+    :param bool rfc4007:
+        Whether to accept ``%`` on its own as the zone ID delimiter, as
+        :data:`rfc3986.misc.IPv6_MATCHER` does. If ``False``, the delimiter
+        must be ``%25`` as in :rfc:`6874`, like
+        :data:`rfc3986.misc.IPv6_NO_RFC4007_MATCHER`.
+    :returns: ``True`` if the corresponding matcher would match ``host``.
+    :rtype: bool
+    """
+    return not host.startswith("[v") and is_ip_literal(host, rfc4007)
+
+
+def is_ip_literal(host: str, rfc4007: bool = True) -> bool:
+    """Check for a bracketed IPv6 or IPvFuture address.
+
+    :param str host: The host to check, including its brackets.
+    :param bool rfc4007:
+        Whether to accept ``%`` on its own as the zone ID delimiter of an
+        IPv6 address, as :func:`is_ipv6_literal` does.
+    :returns:
+        ``True`` if ``host`` is an IP literal that
+        :data:`rfc3986.misc.HOST_MATCHER` would match.
+    :rtype: bool
+    """
+    if host.endswith("\n"):
+        host = host[:-1]
+    return (
+        host.startswith("[")
+        and host.endswith("]")
+        and _is_address(host[1:-1], rfc4007)
+    )
+
+
+def split_authority(authority: str) -> t.Optional[_Subauthority]:
+    """Split an authority whose host is an IP literal.
+
+    This returns the same ``userinfo``, ``host``, and ``port`` groups as
+    :data:`rfc3986.misc.SUBAUTHORITY_MATCHER` for any authority that
+    contains a ``[``. Such an authority can only match when its host is an
+    IP literal.
+
+    :param str authority: The authority to split.
+    :returns:
+        The userinfo, host, and port, or ``None`` if the matcher would not
+        match ``authority``.
+    """
+    if authority.endswith("\n"):
+        authority = authority[:-1]
+    userinfo: t.Optional[str] = None
+    if "@" in authority:
+        userinfo, _, authority = authority.partition("@")
+        if not _is_pct_encoded_run(userinfo, _USERINFO_CHARS):
+            return None
+
+    host, bracket, rest = authority.partition("]")
+    if not (bracket and host.startswith("[") and _is_address(host[1:], True)):
+        return None
+    port: t.Optional[str] = None
+    if rest:
+        port = rest[1:]
+        if rest[0] != ":" or not 0 < len(port) <= 5 or port.strip(_DIGITS):
+            return None
+    return userinfo, host + bracket, port
+
+
+def _is_address(body: str, rfc4007: bool) -> bool:
+    """Check the text between the brackets of an IP literal."""
+    if body.startswith("v"):
+        version, dot, address = body[1:].partition(".")
+        return (
+            bool(version and dot and address)
+            and not version.strip(_HEXDIGITS)
+            and not address.strip(_FUTURE_CHARS)
+        )
+
+    address, percent, zone_id = body.partition("%")
+    if "." in address:
+        # Only the last piece may be an IPv4 address. It fills two pieces.
+        colon = address.rfind(":")
+        if not _is_ipv4(address[colon + 1 :]):
+            return False
+        address = address[: colon + 1] + "0:0"
+    shape = address.encode("ascii", "replace").translate(_HEXDIGIT_SHAPES)
+    if shape.replace(b"xx", b"x").replace(b"xx", b"x") not in _IPV6_SHAPES:
+        return False
+    if not percent:
+        return True
+
+    # "%25" followed by a zone ID is also "%" followed by one, since "25"
+    # is itself a valid start to a zone ID.
+    if not rfc4007:
+        if not zone_id.startswith("25"):
+            return False
+        zone_id = zone_id[2:]
+    return _is_pct_encoded_run(zone_id, _UNRESERVED)
+
+
+def _is_ipv4(address: str) -> bool:
+    # Like abnf_regexp.IPv4_RE, this does not check the range of each octet.
+    shape = address.encode("ascii", "replace").translate(_DIGIT_SHAPES)
+    return (
+        b"xxxx" not in shape
+        and shape.replace(b"xx", b"x").replace(b"xx", b"x") == b"x.x.x.x"
+    )
+
+
+def _is_pct_encoded_run(text: str, allowed: str) -> bool:
+    """Check that text is allowed characters and percent-encodings only."""
+    if not text.strip(allowed):
+        return bool(text)
+    first, *encoded = text.split("%")
+    if first.strip(allowed):
+        return False
+    for part in encoded:
+        if len(part) < 2 or part[:2].strip(_HEXDIGITS):
+            return False
+        if part[2:].strip(allowed):
+            return False
+    return True
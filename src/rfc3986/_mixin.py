@@ -3,13 +3,20 @@
 import typing as t
 import warnings
 
+from . import _ip_literal
 from . import exceptions as exc
 from . import misc
 from . import normalizers
-from . import uri
 from . import validators
 from ._typing_compat import Self as _Self
 
+if t.TYPE_CHECKING:
+    # uri imports this module to subclass URIMixin.
+    from . import uri
+
+
+_RefT = t.TypeVar("_RefT", bound="URIMixin")
+
 
 class _AuthorityInfo(t.TypedDict):
     """A typed dict for the authority info triple: userinfo, host, and port."""
@@ -19,9 +26,63 @@ class _AuthorityInfo(t.TypedDict):
     port: t.Optional[str]
 
 
+def _authority_info_from_match(
+    match: t.Optional[t.Match[str]],
+) -> t.Optional[_AuthorityInfo]:
+    """Turn a match of the subauthority matcher into authority info.
+
+    Returns ``None`` if the authority is not valid.
+    """
+    if match is None:
+        # In this case, we have an authority that was parsed from the URI
+        # Reference, but it cannot be further parsed by our
+        # misc.SUBAUTHORITY_MATCHER. In this case it must not be a valid
+        # authority.
+        return None
+
+    # We had a match, now let's ensure that it is actually a valid host
+    # address if it is IPv4
+    matches = match.groupdict()
+    host = matches.get("host")
+
+    if (
+        host
+        and misc.IPv4_MATCHER.match(host)
+        and not validators.valid_ipv4_host_address(host)
+    ):
+        # If we have a host, it appears to be IPv4 and it does not have
+        # valid bytes, it is an InvalidAuthority.
+        return None
+
+    return t.cast(_AuthorityInfo, matches)
+
+
+def _split_authority(authority: str) -> t.Optional[_AuthorityInfo]:
+    """Split a URI's authority into its userinfo, host, and port.
+
+    Returns ``None`` if the authority is not valid.
+    """
+    # A "[" can only appear in a valid authority as part of an IP literal,
+    # which the scanner checks without trying each IPv6 alternative.
+    if "[" in authority:
+        parts = _ip_literal.split_authority(authority)
+        if parts is None:
+            return None
+        userinfo, host, port = parts
+        return {"userinfo": userinfo, "host": host, "port": port}
+    return _authority_info_from_match(
+        misc.SUBAUTHORITY_MATCHER.match(authority)
+    )
+
+
+_BASE_URI_VALIDATOR = validators.Validator().require_presence_of("scheme")
+
+
 class URIMixin:
     """Mixin with all shared methods for URIs and IRIs."""
 
+    __slots__ = ()
+
     if t.TYPE_CHECKING:
         scheme: t.Optional[str]
         authority: t.Optional[str]
@@ -29,6 +90,8 @@ class URIMixin:
         query: t.Optional[str]
         fragment: t.Optional[str]
         encoding: str
+        _cached_authority_info: t.Optional[_AuthorityInfo]
+        _cached_unsplit: str
 
     def authority_info(self) -> _AuthorityInfo:
         """Return a dictionary with the ``userinfo``, ``host``, and ``port``.
@@ -36,6 +99,10 @@ class URIMixin:
         If the authority is not valid, it will raise a
         :class:`~rfc3986.exceptions.InvalidAuthority` Exception.
 
+        The authority is only parsed the first time this (or one of the
+        ``userinfo``, ``host``, or ``port`` attributes) is accessed. Later
+        accesses reuse that result.
+
         :returns:
             ``{'userinfo': 'username:password', 'host': 'www.example.com',
             'port': '80'}``
@@ -43,52 +110,39 @@ class URIMixin:
         :raises rfc3986.exceptions.InvalidAuthority:
             If the authority is not ``None`` and can not be parsed.
         """
-        if not self.authority:
-            return {"userinfo": None, "host": None, "port": None}
+        return self._authority_info().copy()
 
-        match = self._match_subauthority()
+    def _authority_info(self) -> _AuthorityInfo:
+        try:
+            info = self._cached_authority_info
+        except AttributeError:
+            info = self._cached_authority_info = self._parse_authority_info()
 
-        if match is None:
-            # In this case, we have an authority that was parsed from the URI
-            # Reference, but it cannot be further parsed by our
-            # misc.SUBAUTHORITY_MATCHER. In this case it must not be a valid
-            # authority.
+        if info is None:
+            assert self.authority is not None
             raise exc.InvalidAuthority(self.authority.encode(self.encoding))
+        return info
 
-        # We had a match, now let's ensure that it is actually a valid host
-        # address if it is IPv4
-        matches = match.groupdict()
-        host = matches.get("host")
-
-        if (
-            host
-            and misc.IPv4_MATCHER.match(host)
-            and not validators.valid_ipv4_host_address(host)
-        ):
-            # If we have a host, it appears to be IPv4 and it does not have
-            # valid bytes, it is an InvalidAuthority.
-            raise exc.InvalidAuthority(self.authority.encode(self.encoding))
+    def _parse_authority_info(self) -> t.Optional[_AuthorityInfo]:
+        if not self.authority:
+            return {"userinfo": None, "host": None, "port": None}
 
-        return matches
+        return self._split_authority(self.authority)
 
-    def _match_subauthority(self) -> t.Optional[t.Match[str]]:
-        return misc.SUBAUTHORITY_MATCHER.match(self.authority)
+    def _split_authority(self, authority: str) -> t.Optional[_AuthorityInfo]:
+        return _split_authority(authority)
 
     @property
     def _validator(self) -> validators.Validator:
-        v = getattr(self, "_cached_validator", None)
-        if v is not None:
-            return v
-        self._cached_validator = validators.Validator().require_presence_of(
-            "scheme"
-        )
-        return self._cached_validator
+        # Every reference validates base URIs the same way, so they share
+        # one validator rather than each caching their own.
+        return _BASE_URI_VALIDATOR
 
     @property
     def host(self) -> t.Optional[str]:
         """If present, a string representing the host."""
         try:
-            authority = self.authority_info()
+            authority = self._authority_info()
         except exc.InvalidAuthority:
             return None
         return authority["host"]
@@ -97,7 +151,7 @@ class URIMixin:
     def port(self) -> t.Optional[str]:
         """If present, the port extracted from the authority."""
         try:
-            authority = self.authority_info()
+            authority = self._authority_info()
         except exc.InvalidAuthority:
             return None
         return authority["port"]
@@ -106,7 +160,7 @@ class URIMixin:
     def userinfo(self) -> t.Optional[str]:
         """If present, the userinfo extracted from the authority."""
         try:
-            authority = self.authority_info()
+            authority = self._authority_info()
         except exc.InvalidAuthority:
             return None
         return authority["userinfo"]
@@ -116,11 +170,44 @@ class URIMixin:
 
         See http://tools.ietf.org/html/rfc3986#section-4.3 for explanation.
 
+        The answer is usually found from the components themselves. Only
+        components that could be split differently once unsplit are matched
+        against :data:`~rfc3986.misc.ABSOLUTE_URI_MATCHER` as a whole.
+
         :returns: ``True`` if it is an absolute URI, ``False`` otherwise.
         :rtype: bool
         """
+        # Nothing in an absolute URI matches the "#" before a fragment, and
+        # without a scheme the string must still start with one.
+        if self.fragment is not None:
+            return False
+        if not self.scheme:
+            if self.authority or not misc._SCHEME_PREFIX_MATCHER.match(
+                self.path or ""
+            ):
+                return False
+        elif self._components_are_absolute():
+            return True
         return bool(misc.ABSOLUTE_URI_MATCHER.match(self.unsplit()))
 
+    def _components_are_absolute(self) -> bool:
+        # When every component matches its own piece of the pattern, the
+        # pattern matches the unsplit string. Otherwise it still might.
+        query = self.query
+        if query is not None and not misc._ABSOLUTE_QUERY_MATCHER.fullmatch(
+            query
+        ):
+            return False
+        if not misc.SCHEME_MATCHER.match(self.scheme or ""):
+            return False
+        path = self.path or ""
+        if self.authority:
+            return bool(
+                misc._ABSOLUTE_AUTHORITY_MATCHER.fullmatch(self.authority)
+                and misc._ABSOLUTE_PATH_ABEMPTY_MATCHER.fullmatch(path)
+            )
+        return bool(misc._ABSOLUTE_PATH_MATCHER.fullmatch(path))
+
     def is_valid(self, **kwargs: bool) -> bool:
         """Determine if the URI is valid.
 
@@ -271,7 +358,7 @@ class URIMixin:
         """
         return tuple(self.normalize()) == tuple(other_ref.normalize())
 
-    def resolve_with(  # noqa: C901
+    def resolve_with(
         self,
         base_uri: t.Union[str, "uri.URIReference"],
         strict: bool = False,
@@ -283,6 +370,9 @@ class URIMixin:
 
         See http://tools.ietf.org/html/rfc3986#section-5 for more information.
 
+        If many references need to be resolved against the same base, use
+        :meth:`resolver` on the base instead.
+
         :param base_uri: Either a string or URIReference. It must be an
             absolute URI or it will raise an exception.
         :returns: A new URIReference which is the result of resolving this
@@ -295,67 +385,43 @@ class URIMixin:
             base_uri = type(self).from_string(base_uri)
 
         if t.TYPE_CHECKING:
-            base_uri = t.cast(uri.URIReference, base_uri)
+            base_uri = t.cast("uri.URIReference", base_uri)
 
-        try:
-            self._validator.validate(base_uri)
-        except exc.ValidationError:
-            raise exc.ResolutionError(base_uri)
+        return Resolver(base_uri, self._validator).resolve(self, strict)
 
-        # This is optional per
-        # http://tools.ietf.org/html/rfc3986#section-5.2.1
-        base_uri = base_uri.normalize()
+    def resolver(self) -> "Resolver":
+        """Create a :class:`Resolver` that uses this reference as its base.
 
-        # The reference we're resolving
-        resolving = self
+        The base is validated and normalized once, so resolving many
+        references with the :class:`Resolver` is cheaper than calling
+        :meth:`resolve_with` for each of them.
 
-        if not strict and resolving.scheme == base_uri.scheme:
-            resolving = resolving.copy_with(scheme=None)
+        .. versionadded:: 2.1.0
 
-        # http://tools.ietf.org/html/rfc3986#page-32
-        if resolving.scheme is not None:
-            target = resolving.copy_with(
-                path=normalizers.normalize_path(resolving.path)
-            )
-        else:
-            if resolving.authority is not None:
-                target = resolving.copy_with(
-                    scheme=base_uri.scheme,
-                    path=normalizers.normalize_path(resolving.path),
-                )
-            else:
-                if resolving.path is None:
-                    if resolving.query is not None:
-                        query = resolving.query
-                    else:
-                        query = base_uri.query
-                    target = resolving.copy_with(
-                        scheme=base_uri.scheme,
-                        authority=base_uri.authority,
-                        path=base_uri.path,
-                        query=query,
-                    )
-                else:
-                    if resolving.path.startswith("/"):
-                        path = normalizers.normalize_path(resolving.path)
-                    else:
-                        path = normalizers.normalize_path(
-                            misc.merge_paths(base_uri, resolving.path)
-                        )
-                    target = resolving.copy_with(
-                        scheme=base_uri.scheme,
-                        authority=base_uri.authority,
-                        path=path,
-                        query=resolving.query,
-                    )
-        return target
+        :returns: A resolver for this base URI.
+        :rtype: :class:`~rfc3986.uri.Resolver`
+        :raises rfc3986.exceptions.ResolutionError:
+            If this reference does not at least have a scheme.
+        """
+        return Resolver(t.cast("uri.URIReference", self), self._validator)
 
     def unsplit(self) -> str:
         """Create a URI string from the components.
 
+        References are immutable, so the string is only built the first time
+        this is called.
+
         :returns: The URI Reference reconstituted as a string.
         :rtype: str
         """
+        try:
+            return self._cached_unsplit
+        except AttributeError:
+            pass
+        unsplit = self._cached_unsplit = self._join_components()
+        return unsplit
+
+    def _join_components(self) -> str:
         # See http://tools.ietf.org/html/rfc3986#section-5.3
         result_list: list[str] = []
         if self.scheme:
@@ -405,6 +471,122 @@ class URIMixin:
         for key, value in list(attributes.items()):
             if value is misc.UseExisting:
                 del attributes[key]
-        uri: _Self = self._replace(**attributes)
-        uri.encoding = self.encoding
-        return uri
+        return self._replace(**attributes)
+
+
+class Resolver:
+    """Resolve many references against the same base URI.
+
+    .. versionadded:: 2.1.0
+
+    Resolvers are created with :meth:`URIMixin.resolver`, for example::
+
+        >>> from rfc3986 import uri_reference
+        >>> resolver = uri_reference('http://example.com/a/b').resolver()
+        >>> resolver.resolve('../c').unsplit()
+        'http://example.com/c'
+
+    Resolving a reference gives the same result as
+    ``reference.resolve_with(base)``.
+    """
+
+    def __init__(
+        self,
+        base_uri: "uri.URIReference",
+        validator: t.Optional[validators.Validator] = None,
+    ) -> None:
+        """Validate and normalize the base URI."""
+        if validator is None:
+            validator = _BASE_URI_VALIDATOR
+        try:
+            validator.validate(base_uri)
+        except exc.ValidationError:
+            raise exc.ResolutionError(base_uri)
+
+        # This is optional per
+        # http://tools.ietf.org/html/rfc3986#section-5.2.1
+        self.base_uri = base_uri.normalize()
+        # Everything misc.merge_paths puts in front of the relative path.
+        self._merge_prefix = misc.merge_paths(self.base_uri, "")
+
+    def resolve(
+        self,
+        reference: t.Union[str, "uri.URIReference"],
+        strict: bool = False,
+    ) -> "uri.URIReference":
+        """Resolve a reference against the base URI.
+
+        :param reference: Either a string or URIReference to resolve.
+        :param bool strict: (optional) Whether to follow :rfc:`3986` strictly
+            when the reference has the same scheme as the base.
+        :returns: A new URIReference which is the result of resolving
+            ``reference`` using the base URI.
+        :rtype: :class:`URIReference`
+        """
+        if not isinstance(reference, URIMixin):
+            from . import uri
+
+            reference = uri.URIReference.from_string(reference)
+        return self._resolve(reference, strict)
+
+    def resolve_many(
+        self,
+        references: t.Iterable[t.Union[str, "uri.URIReference"]],
+        strict: bool = False,
+    ) -> t.Iterator["uri.URIReference"]:
+        """Lazily resolve each of the references against the base URI.
+
+        :param references: Iterable of strings or URIReferences to resolve.
+        :param bool strict: (optional) Passed to :meth:`resolve`.
+        :returns: Iterator of resolved references
+        """
+        for reference in references:
+            yield self.resolve(reference, strict)
+
+    def _resolve(  # noqa: C901
+        self,
+        resolving: _RefT,
+        strict: bool,
+    ) -> _RefT:
+        base_uri = self.base_uri
+
+        if not strict and resolving.scheme == base_uri.scheme:
+            resolving = resolving.copy_with(scheme=None)
+
+        # http://tools.ietf.org/html/rfc3986#page-32
+        if resolving.scheme is not None:
+            target = resolving.copy_with(
+                path=normalizers.normalize_path(resolving.path)
+            )
+        else:
+            if resolving.authority is not None:
+                target = resolving.copy_with(
+                    scheme=base_uri.scheme,
+                    path=normalizers.normalize_path(resolving.path),
+                )
+            else:
+                if resolving.path is None:
+                    if resolving.query is not None:
+                        query = resolving.query
+                    else:
+                        query = base_uri.query
+                    target = resolving.copy_with(
+                        scheme=base_uri.scheme,
+                        authority=base_uri.authority,
+                        path=base_uri.path,
+                        query=query,
+                    )
+                else:
+                    if resolving.path.startswith("/"):
+                        path = normalizers.normalize_path(resolving.path)
+                    else:
+                        path = normalizers.normalize_path(
+                            self._merge_prefix + resolving.path
+                        )
+                    target = resolving.copy_with(
+                        scheme=base_uri.scheme,
+                        authority=base_uri.authority,
+                        path=path,
+                        query=resolving.query,
+                    )
+        return target
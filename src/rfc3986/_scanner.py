@@ -0,0 +1,115 @@
+"""Module containing a single-pass splitter for URI references.
+
+This is a hand-written equivalent of :data:`rfc3986.misc.URI_MATCHER`. It
+finds the component boundaries described in :rfc:`3986#appendix-B` with a
+handful of string operations instead of running a regular expression and
+building a match dictionary.
+"""
+
+import typing as t
+
+from . import abnf_regexp
+
+__all__ = ("split", "split_bytes")
+
+_SCHEME_CHARS = abnf_regexp.ALPHA + abnf_regexp.DIGIT + "+-."
+_SCHEME_BYTES = _SCHEME_CHARS.encode()
+
+_Components = t.Tuple[
+    t.Optional[str],
+    t.Optional[str],
+    str,
+    t.Optional[str],
+    t.Optional[str],
+]
+_BytesComponents = t.Tuple[
+    t.Optional[bytes],
+    t.Optional[bytes],
+    bytes,
+    t.Optional[bytes],
+    t.Optional[bytes],
+]
+
+
+def split(uri_string: str) -> _Components:
+    """Split a URI reference into its five components.
+
+    This returns the same values as the ``scheme``, ``authority``, ``path``,
+    ``query``, and ``fragment`` groups of :data:`rfc3986.misc.URI_MATCHER`.
+
+    :param str uri_string: The URI reference to split.
+    :returns: ``(scheme, authority, path, query, fragment)``
+    :rtype: tuple
+    """
+    scheme = authority = query = fragment = None
+    rest = uri_string
+
+    # None of the scheme, authority, path, or query may contain a "#", so the
+    # first one always starts the fragment. Likewise, the first "?" that
+    # precedes the fragment always starts the query.
+    if "#" in rest:
+        rest, _, fragment = rest.partition("#")
+    if "?" in rest:
+        rest, _, query = rest.partition("?")
+
+    # The scheme, if any, is everything up to the first ":" as long as it
+    # only contains characters that are allowed in a scheme.
+    colon = rest.find(":")
+    if colon > 0:
+        scheme = rest[:colon]
+        if scheme[0].isalpha() and not scheme.strip(_SCHEME_CHARS):
+            rest = rest[colon + 1 :]
+        else:
+            scheme = None
+
+    if rest[:2] == "//":
+        end = rest.find("/", 2)
+        if end == -1:
+            end = len(rest)
+        if "\\" in rest:
+            backslash = rest.find("\\", 2, end)
+            if backslash != -1:
+                end = backslash
+        authority = rest[2:end]
+        rest = rest[end:]
+
+    return scheme, authority, rest, query, fragment
+
+
+def split_bytes(uri_bytes: bytes) -> _BytesComponents:
+    """Split a URI reference held in :class:`bytes` into its components.
+
+    This is :func:`split` for bytes. Keep the two in sync.
+
+    :param bytes uri_bytes: The URI reference to split.
+    :returns: ``(scheme, authority, path, query, fragment)``
+    :rtype: tuple
+    """
+    scheme = authority = query = fragment = None
+    rest = uri_bytes
+
+    if b"#" in rest:
+        rest, _, fragment = rest.partition(b"#")
+    if b"?" in rest:
+        rest, _, query = rest.partition(b"?")
+
+    colon = rest.find(b":")
+    if colon > 0:
+        scheme = rest[:colon]
+        if scheme[:1].isalpha() and not scheme.strip(_SCHEME_BYTES):
+            rest = rest[colon + 1 :]
+        else:
+            scheme = None
+
+    if rest[:2] == b"//":
+        end = rest.find(b"/", 2)
+        if end == -1:
+            end = len(rest)
+        if b"\\" in rest:
+            backslash = rest.find(b"\\", 2, end)
+            if backslash != -1:
+                end = backslash
+        authority = rest[2:end]
+        rest = rest[end:]
+
+    return scheme, authority, rest, query, fragment
@@ -42,6 +42,44 @@ def uri_reference(
     return URIReference.from_string(uri, encoding)
 
 
+@t.overload
+def parse_many(  # noqa: D103
+    uris: t.Iterable[t.Union[str, bytes]],
+    encoding: str = ...,
+    on_error: t.Literal["raise", "skip"] = ...,
+) -> t.Iterator[URIReference]: ...
+
+
+@t.overload
+def parse_many(  # noqa: D103
+    uris: t.Iterable[t.Union[str, bytes]],
+    encoding: str = ...,
+    *,
+    on_error: t.Literal["yield"],
+) -> t.Iterator[t.Union[URIReference, Exception]]: ...
+
+
+def parse_many(
+    uris: t.Iterable[t.Union[str, bytes]],
+    encoding: str = "utf-8",
+    on_error: t.Literal["raise", "skip", "yield"] = "raise",
+) -> t.Iterator[t.Union[URIReference, Exception]]:
+    """Lazily parse many URI strings into URIReferences.
+
+    This is a convenience function. You could achieve the same end by using
+    ``URIReference.from_strings(uris)``.
+
+    .. versionadded:: 2.1.0
+
+    :param uris: An iterable of URIs which need to be parsed.
+    :param str encoding: The encoding of the strings provided
+    :param str on_error: ``"raise"``, ``"skip"``, or ``"yield"``. See
+        :meth:`URIReference.from_strings` for details.
+    :returns: Iterator of parsed URIs
+    """
+    return URIReference.from_strings(uris, encoding, on_error=on_error)
+
+
 def iri_reference(
     iri: t.Union[str, bytes],
     encoding: str = "utf-8",
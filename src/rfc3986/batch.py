@@ -0,0 +1,300 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Module containing functions to process large batches of URIs."""
+
+import collections
+import itertools
+import typing as t
+
+from . import _mixin
+from . import _scanner
+from . import compat
+from . import exceptions
+from . import iri
+from . import misc
+from . import normalizers
+from . import parseresult
+from . import uri
+
+if t.TYPE_CHECKING:
+    from concurrent.futures import Future
+
+__all__ = ("Columns", "iri_to_uri_many", "normalize_many", "parse_columns")
+
+_T = t.TypeVar("_T")
+_R = t.TypeVar("_R")
+
+
+def normalize_many(
+    uris: t.Iterable[t.Union[str, bytes]],
+    encoding: str = "utf-8",
+    workers: t.Optional[int] = None,
+    chunksize: int = 1000,
+) -> t.Iterator[str]:
+    """Normalize many URIs, optionally using several processes.
+
+    This yields the same strings, in the same order, as calling
+    :func:`~rfc3986.api.normalize_uri` on each URI.
+
+    When ``workers`` is greater than one, the URIs are split into chunks of
+    ``chunksize`` and normalized in a
+    :class:`~concurrent.futures.ProcessPoolExecutor`. Only a bounded number
+    of chunks are in flight at any time, so ``uris`` may be arbitrarily
+    large. If there are no more than ``workers * chunksize`` URIs, they are
+    normalized in the current process since starting the pool would cost
+    more than it saves.
+
+    .. versionadded:: 2.1.0
+
+    :param uris: An iterable of URIs to normalize.
+    :param str encoding: The encoding of the strings provided
+    :param int workers: (optional) The number of processes to use. By
+        default everything is done in the current process.
+    :param int chunksize: (optional) The number of URIs sent to a worker at
+        once.
+    :returns: Iterator of normalized URIs
+    :rtype: str
+    """
+    return _map_chunks(_normalize_chunk, uris, workers, chunksize, encoding)
+
+
+def iri_to_uri_many(
+    iris: t.Iterable[t.Union[str, bytes]],
+    encoding: str = "utf-8",
+    workers: t.Optional[int] = None,
+    chunksize: int = 1000,
+) -> t.Iterator[str]:
+    """Convert many IRIs to URIs, optionally using several processes.
+
+    This yields the same strings, in the same order, as calling
+    ``IRIReference.from_string(iri).encode().unsplit()`` on each IRI, but
+    no :class:`~rfc3986.iri.IRIReference` is created. Hosts are encoded
+    with IDNA through the same cache as
+    :meth:`~rfc3986.iri.IRIReference.encode`.
+
+    ``workers`` and ``chunksize`` behave as they do for
+    :func:`normalize_many`. Each worker process has its own IDNA cache.
+
+    .. versionadded:: 2.1.0
+
+    :param iris: An iterable of IRIs to convert.
+    :param str encoding: The encoding of the strings provided
+    :param int workers: (optional) The number of processes to use. By
+        default everything is done in the current process.
+    :param int chunksize: (optional) The number of IRIs sent to a worker at
+        once.
+    :returns: Iterator of URIs
+    :rtype: str
+    :raises rfc3986.exceptions.InvalidAuthority:
+        If a host cannot be encoded with IDNA.
+    """
+    return _map_chunks(_iri_to_uri_chunk, iris, workers, chunksize, encoding)
+
+
+class Columns(t.NamedTuple):
+    """Components of many URIs, one list per component.
+
+    The lists are parallel: the components of the URI at position ``i`` of
+    the input are at position ``i`` of every list.
+
+    .. versionadded:: 2.1.0
+    """
+
+    scheme: t.List[t.Optional[str]]
+    userinfo: t.List[t.Optional[str]]
+    host: t.List[t.Optional[str]]
+    port: t.List[t.Optional[int]]
+    path: t.List[t.Optional[str]]
+    query: t.List[t.Optional[str]]
+    fragment: t.List[t.Optional[str]]
+    #: ``False`` for URIs that could not be parsed. Every component of
+    #: those URIs is ``None``.
+    valid: t.List[bool]
+
+
+def parse_columns(
+    uris: t.Iterable[t.Union[str, bytes]],
+    encoding: str = "utf-8",
+    strict: bool = True,
+) -> Columns:
+    """Parse many URIs into columns of components.
+
+    For every URI that can be parsed, the components are the same as the
+    attributes of :meth:`ParseResult.from_string
+    <rfc3986.parseresult.ParseResult.from_string>`, but no objects are
+    created for individual URIs. URIs that
+    :meth:`~rfc3986.parseresult.ParseResult.from_string` would reject are
+    marked as not valid instead of raising an exception.
+
+    .. versionadded:: 2.1.0
+
+    :param uris: An iterable of URIs to parse.
+    :param str encoding: The encoding of the strings provided
+    :param bool strict: Parse strictly according to :rfc:`3986` if True.
+        If False, parse similarly to the standard library's urlparse
+        function.
+    :returns: The components of the URIs
+    :rtype: :class:`Columns`
+    """
+    columns = Columns([], [], [], [], [], [], [], [])
+    append_row = [column.append for column in columns]
+    invalid_row = (None,) * 7 + (False,)
+    for uri_string in uris:
+        try:
+            row = _parse_row(uri_string, encoding, strict)
+        except (exceptions.RFC3986Exception, TypeError, ValueError):
+            row = invalid_row
+        for append, value in zip(append_row, row):
+            append(value)
+    return columns
+
+
+def _parse_row(
+    uri_string: t.Union[str, bytes],
+    encoding: str,
+    strict: bool,
+) -> t.Tuple[t.Any, ...]:
+    uri_string = compat.to_str(uri_string, encoding)
+    scheme, authority, path, query, fragment = _scanner.split(uri_string)
+
+    userinfo = host = port = None
+    if authority:
+        info = _mixin._split_authority(authority)
+        if info is not None:
+            userinfo, host, port = info["userinfo"], info["host"], info["port"]
+        elif strict:
+            raise exceptions.InvalidAuthority(authority.encode(encoding))
+        else:
+            userinfo, host, port = parseresult.split_authority(authority)
+
+    encode = normalizers.encode_component
+    return (
+        scheme,
+        userinfo or None,
+        host,
+        parseresult.port_number(port) or None,
+        encode(path, encoding) or None,
+        encode(query, encoding),
+        encode(fragment, encoding),
+        True,
+    )
+
+
+def _normalize_chunk(
+    chunk: t.List[t.Union[str, bytes]],
+    encoding: str,
+) -> t.List[str]:
+    from_string = uri.URIReference.from_string
+    return [from_string(u, encoding).normalize().unsplit() for u in chunk]
+
+
+def _iri_to_uri_chunk(
+    chunk: t.List[t.Union[str, bytes]],
+    encoding: str,
+) -> t.List[str]:
+    to_str = compat.to_str
+    split = _scanner.split
+    encode = normalizers.encode_component
+    match_subauthority = misc.ISUBAUTHORITY_MATCHER.match
+    # Batches tend to repeat a few hosts, so each authority is only parsed
+    # and encoded once per chunk.
+    encoded_authorities: t.Dict[str, str] = {}
+    results: t.List[str] = []
+    for iri_string in chunk:
+        scheme, authority, path, query, fragment = split(
+            to_str(iri_string, encoding)
+        )
+        if authority:
+            encoded = encoded_authorities.get(authority)
+            if encoded is None:
+                info = _mixin._authority_info_from_match(
+                    match_subauthority(authority)
+                )
+                encoded = iri._encode_authority(
+                    authority, info, encoding, None
+                )
+                encoded_authorities[authority] = encoded
+            authority = encoded
+        reference = uri.URIReference(
+            scheme,
+            authority,
+            encode(path, encoding),
+            encode(query, encoding),
+            encode(fragment, encoding),
+            encoding,
+        )
+        results.append(reference.unsplit())
+    return results
+
+
+def _chunked(iterable: t.Iterable[_T], size: int) -> t.Iterator[t.List[_T]]:
+    iterator = iter(iterable)
+    return iter(lambda: list(itertools.islice(iterator, size)), [])
+
+
+def _map_chunks(
+    func: t.Callable[[t.List[_T], str], t.List[_R]],
+    items: t.Iterable[_T],
+    workers: t.Optional[int],
+    chunksize: int,
+    encoding: str,
+) -> t.Iterator[_R]:
+    """Apply ``func`` to chunks of ``items`` and yield results in order."""
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, not {chunksize!r}")
+    chunks = _chunked(items, chunksize)
+    if not workers or workers <= 1:
+        return itertools.chain.from_iterable(
+            func(chunk, encoding) for chunk in chunks
+        )
+    return _map_chunks_lazily(func, chunks, workers, encoding)
+
+
+def _map_chunks_lazily(
+    func: t.Callable[[t.List[_T], str], t.List[_R]],
+    chunks: t.Iterator[t.List[_T]],
+    workers: int,
+    encoding: str,
+) -> t.Iterator[_R]:
+    # Look ahead far enough to know whether the pool would be worth it,
+    # but only once iteration starts.
+    head = list(itertools.islice(chunks, workers + 1))
+    if len(head) <= workers:
+        for chunk in head:
+            yield from func(chunk, encoding)
+        return
+    yield from _map_chunks_in_pool(
+        func, itertools.chain(head, chunks), workers, encoding
+    )
+
+
+def _map_chunks_in_pool(
+    func: t.Callable[[t.List[_T], str], t.List[_R]],
+    chunks: t.Iterable[t.List[_T]],
+    workers: int,
+    encoding: str,
+) -> t.Iterator[_R]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending: "t.Deque[Future[t.List[_R]]]" = collections.deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk, encoding))
+            # Keep every worker busy while bounding how much is buffered.
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+    finally:
+        executor.shutdown(cancel_futures=True)
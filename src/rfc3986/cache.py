@@ -0,0 +1,131 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Module containing the opt-in cache of parsed references.
+
+Example usage::
+
+    >>> from rfc3986 import cache, uri_reference
+    >>> cache.parse_cache.resize(4096)
+    >>> uri_reference('https://github.com/') is uri_reference(
+    ...     'https://github.com/'
+    ... )
+    True
+    >>> cache.parse_cache.cache_info()
+    CacheInfo(hits=1, misses=1, evictions=0, maxsize=4096, currsize=1)
+
+"""
+
+import collections
+import threading
+import typing as t
+
+__all__ = ("CacheInfo", "ParseCache", "parse_cache")
+
+
+class CacheInfo(t.NamedTuple):
+    """Statistics about a :class:`ParseCache`."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int
+    currsize: int
+
+
+class ParseCache:
+    """Thread-safe, size-bounded LRU cache of parsed references.
+
+    Parsed references are immutable, so a single instance can safely be
+    handed out to every caller that parses the same string.
+
+    .. versionadded:: 2.1.0
+    """
+
+    def __init__(self, maxsize: int = 0) -> None:
+        """Initialize the cache. A ``maxsize`` of ``0`` disables it."""
+        self._lock = threading.Lock()
+        self._entries: t.OrderedDict[t.Hashable, t.Any] = (
+            collections.OrderedDict()
+        )
+        self._maxsize = 0
+        self._hits = self._misses = self._evictions = 0
+        self.resize(maxsize)
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of references kept in the cache."""
+        return self._maxsize
+
+    def resize(self, maxsize: int) -> None:
+        """Change the maximum number of cached references.
+
+        Least recently used references are evicted if the cache holds more
+        than ``maxsize`` entries. A ``maxsize`` of ``0`` disables the cache.
+
+        :param int maxsize: The new maximum size.
+        :raises ValueError: If ``maxsize`` is negative.
+        """
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, not {maxsize!r}")
+        with self._lock:
+            self._maxsize = maxsize
+            self._evict()
+
+    def get(self, key: t.Hashable) -> t.Any:
+        """Return the reference cached for ``key`` or ``None``."""
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: t.Hashable, value: t.Any) -> None:
+        """Cache ``value`` for ``key``, evicting old entries if necessary."""
+        with self._lock:
+            if not self._maxsize:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._evict()
+
+    def cache_info(self) -> CacheInfo:
+        """Return the hit, miss, and eviction counters and the sizes."""
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._entries),
+            )
+
+    def cache_clear(self) -> None:
+        """Remove every cached reference and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def _evict(self) -> None:
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+
+#: The cache consulted by :meth:`rfc3986.uri.URIReference.from_string` and
+#: :meth:`rfc3986.iri.IRIReference.from_string`. It is disabled until it is
+#: given a size with :meth:`ParseCache.resize`.
+parse_cache = ParseCache()
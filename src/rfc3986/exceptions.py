@@ -3,7 +3,9 @@
 import typing as t
 
 from . import compat
-from . import uri
+
+if t.TYPE_CHECKING:
+    from . import uri
 
 
 class RFC3986Exception(Exception):
@@ -14,8 +14,11 @@
 # implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import typing as t
 
+from . import _mixin
+from . import cache
 from . import compat
 from . import exceptions
 from . import misc
@@ -23,11 +26,6 @@ from . import normalizers
 from . import uri
 from ._typing_compat import Self as _Self
 
-try:
-    import idna
-except ImportError:  # pragma: no cover
-    idna = None
-
 
 class IRIReference(misc.URIReferenceBase, uri.URIMixin):
     """Immutable object representing a parsed IRI Reference.
@@ -40,7 +38,9 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
         the future. Check for changes to the interface when upgrading.
     """
 
-    encoding: str
+    # Only references with another encoding store one, so that references
+    # that are just parsed and read never allocate an instance dictionary.
+    encoding: str = "utf-8"
 
     def __new__(
         cls,
@@ -60,11 +60,25 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
             query,
             fragment,
         )
-        ref.encoding = encoding
+        if encoding != ref.encoding:
+            ref.encoding = encoding
         return ref
 
     __hash__ = tuple.__hash__
 
+    def __getstate__(self) -> t.Optional[t.Dict[str, str]]:
+        """Pickle the encoding, if it is not the default, but no caches."""
+        if self.encoding == type(self).encoding:
+            return None
+        return {"encoding": self.encoding}
+
+    def _replace(self, **kwargs: t.Any) -> _Self:
+        """Replace components, keeping a non-default encoding."""
+        ref = super()._replace(**kwargs)
+        if ref.encoding != self.encoding:
+            ref.encoding = self.encoding
+        return ref
+
     def __eq__(self, other: object) -> bool:
         """Compare this reference to another."""
         other_ref = other
@@ -83,8 +97,14 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
         # See http://tools.ietf.org/html/rfc3986#section-6.2
         return tuple(self) == tuple(other_ref)
 
-    def _match_subauthority(self) -> t.Optional[t.Match[str]]:
-        return misc.ISUBAUTHORITY_MATCHER.match(self.authority)
+    def _split_authority(
+        self, authority: str
+    ) -> t.Optional[_mixin._AuthorityInfo]:
+        # The port delimiter is optional in ISUBAUTHORITY_MATCHER, so IRIs
+        # keep using it rather than the IP literal scanner.
+        return _mixin._authority_info_from_match(
+            misc.ISUBAUTHORITY_MATCHER.match(authority)
+        )
 
     @classmethod
     def from_string(
@@ -98,6 +118,21 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
         :param str encoding: The encoding of the string provided
         :returns: :class:`IRIReference` or subclass thereof
         """
+        if cache.parse_cache.maxsize and isinstance(iri_string, (str, bytes)):
+            key = (iri_string, encoding, cls)
+            reference = cache.parse_cache.get(key)
+            if reference is None:
+                reference = cls._from_string(iri_string, encoding)
+                cache.parse_cache.put(key, reference)
+            return reference
+        return cls._from_string(iri_string, encoding)
+
+    @classmethod
+    def _from_string(
+        cls,
+        iri_string: t.Union[str, bytes],
+        encoding: str,
+    ) -> _Self:
         iri_string = compat.to_str(iri_string, encoding)
 
         split_iri = misc.IRI_MATCHER.match(iri_string).groupdict()
@@ -110,9 +145,9 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
             encoding,
         )
 
-    def encode(  # noqa: C901
+    def encode(
         self,
-        idna_encoder: t.Optional[  # pyright: ignore[reportRedeclaration]
+        idna_encoder: t.Optional[
             t.Callable[[str], t.Union[str, bytes]]
         ] = None,
     ) -> "uri.URIReference":
@@ -120,54 +155,27 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
 
         If the ``idna`` module is installed or the ``rfc3986[idna]``
         extra is used then unicode characters in the IRI host
-        component will be encoded with IDNA2008.
+        component will be encoded with IDNA2008. Hosts encoded that way are
+        remembered, up to :data:`IDNA_CACHE_SIZE` of them, so encoding the
+        same host again does not run IDNA again. The ``idna`` module is only
+        imported once a host that is not ASCII needs it.
 
         :param idna_encoder:
             Function that encodes each part of the host component
-            If not given will raise an exception if the IRI
-            contains a host component.
+            If not given and ``idna`` is not installed, will raise an
+            exception if the IRI host is not ASCII.
         :rtype: uri.URIReference
         :returns: A URI reference
         """
         authority = self.authority
         if authority:
-            if idna_encoder is None:
-                if idna is None:  # pragma: no cover
-                    raise exceptions.MissingDependencyError(
-                        "Could not import the 'idna' module "
-                        "and the IRI hostname requires encoding"
-                    )
-
-                def idna_encoder(name: str) -> t.Union[str, bytes]:
-                    assert idna  # Known to not be None at this point.
-
-                    if any(ord(c) > 128 for c in name):
-                        try:
-                            return idna.encode(
-                                name.lower(), strict=True, std3_rules=True
-                            )
-                        except idna.IDNAError:
-                            raise exceptions.InvalidAuthority(self.authority)
-                    return name
-
-            authority = ""
-            if self.host:
-                authority = ".".join(
-                    [
-                        compat.to_str(idna_encoder(part))
-                        for part in self.host.split(".")
-                    ]
-                )
-
-            if self.userinfo is not None:
-                authority = (
-                    normalizers.encode_component(self.userinfo, self.encoding)
-                    + "@"
-                    + authority
-                )
-
-            if self.port is not None:
-                authority += ":" + str(self.port)
+            try:
+                info = self._authority_info()
+            except exceptions.InvalidAuthority:
+                info = None
+            authority = _encode_authority(
+                authority, info, self.encoding, idna_encoder
+            )
 
         return uri.URIReference(
             self.scheme,
@@ -177,3 +185,85 @@ class IRIReference(misc.URIReferenceBase, uri.URIMixin):
             fragment=self.fragment,
             encoding=self.encoding,
         )
+
+
+#: The number of hosts whose IDNA encoding :meth:`IRIReference.encode`
+#: remembers. This is read once, when the module is imported, so changing it
+#: afterwards has no effect.
+IDNA_CACHE_SIZE: t.Final = 4096
+
+
+def _encode_authority(
+    authority: str,
+    info: t.Optional[_mixin._AuthorityInfo],
+    encoding: str,
+    idna_encoder: t.Optional[t.Callable[[str], t.Union[str, bytes]]],
+) -> str:
+    """Encode an IRI authority, given its parsed ``info``, for a URI.
+
+    ``info`` is ``None`` for an authority that cannot be parsed, which
+    encodes to an empty authority.
+    """
+    if info is None:
+        return ""
+
+    encoded = ""
+    host = info["host"]
+    if host:
+        encoded = _encode_host(authority, host, idna_encoder)
+
+    if info["userinfo"] is not None:
+        encoded = (
+            normalizers.encode_component(info["userinfo"], encoding)
+            + "@"
+            + encoded
+        )
+
+    if info["port"] is not None:
+        encoded += ":" + str(info["port"])
+    return encoded
+
+
+def _encode_host(
+    authority: str,
+    host: str,
+    idna_encoder: t.Optional[t.Callable[[str], t.Union[str, bytes]]],
+) -> str:
+    if idna_encoder is not None:
+        return ".".join(
+            [compat.to_str(idna_encoder(part)) for part in host.split(".")]
+        )
+    if host.isascii():
+        # No label needs encoding, so there is nothing to split.
+        return host
+
+    encoded = _idna_encode_host(host)
+    if encoded is None:
+        raise exceptions.InvalidAuthority(authority)
+    return encoded
+
+
+@functools.lru_cache(maxsize=IDNA_CACHE_SIZE)
+def _idna_encode_host(host: str) -> t.Optional[str]:
+    # Returns None for a host that IDNA rejects. The idna module is only
+    # imported here, once a host needs it, to keep importing rfc3986 fast.
+    try:
+        import idna
+    except ImportError:  # pragma: no cover
+        raise exceptions.MissingDependencyError(
+            "Could not import the 'idna' module "
+            "and the IRI hostname requires encoding"
+        )
+
+    labels: t.List[str] = []
+    for label in host.split("."):
+        if any(ord(c) > 128 for c in label):
+            try:
+                encoded = idna.encode(
+                    label.lower(), strict=True, std3_rules=True
+                )
+            except idna.IDNAError:
+                return None
+            label = compat.to_str(encoded)
+        labels.append(label)
+    return ".".join(labels)
@@ -54,76 +54,121 @@ RESERVED_CHARS = abnf_regexp.RESERVED_CHARS_SET
 UNRESERVED_CHARS = abnf_regexp.UNRESERVED_CHARS_SET
 NON_PCT_ENCODED = abnf_regexp.NON_PCT_ENCODED_SET
 
-URI_MATCHER = re.compile(abnf_regexp.URL_PARSING_RE)
+# Every matcher is compiled by __getattr__ the first time it is used. Most
+# processes only need a few of them, and some, like the IPv6 and absolute URI
+# patterns, are large.
+if t.TYPE_CHECKING:
+    URI_MATCHER: t.Pattern[str]
+    SUBAUTHORITY_MATCHER: t.Pattern[str]
+    HOST_MATCHER: t.Pattern[str]
+    IPv4_MATCHER: t.Pattern[str]
+    IPv6_MATCHER: t.Pattern[str]
+    IPv6_NO_RFC4007_MATCHER: t.Pattern[str]
+    PATH_MATCHER: t.Pattern[str]
+    QUERY_MATCHER: t.Pattern[str]
+    FRAGMENT_MATCHER: t.Pattern[str]
+    SCHEME_MATCHER: t.Pattern[str]
+    RELATIVE_REF_MATCHER: t.Pattern[str]
+    ABSOLUTE_URI_MATCHER: t.Pattern[str]
+    _ABSOLUTE_AUTHORITY_MATCHER: t.Pattern[str]
+    _ABSOLUTE_PATH_ABEMPTY_MATCHER: t.Pattern[str]
+    _ABSOLUTE_PATH_MATCHER: t.Pattern[str]
+    _ABSOLUTE_QUERY_MATCHER: t.Pattern[str]
+    _SCHEME_PREFIX_MATCHER: t.Pattern[str]
+    IRI_MATCHER: t.Pattern[str]
+    ISUBAUTHORITY_MATCHER: t.Pattern[str]
+
+# The pieces of ABSOLUTE_URI_MATCHER, used with fullmatch() to check the
+# components of a reference without unsplitting it. The path and query
+# patterns accept the same strings as PATH_ABEMPTY, PATH_ABSOLUTE,
+# PATH_ROOTLESS, PATH_EMPTY, and QUERY_RE, written so that they do not
+# need a group per character.
+_PATH_CHARS_RE = "[/:@%s%s]*(?:%s[/:@%s%s]*)*" % (
+    abnf_regexp.UNRESERVED_RE,
+    abnf_regexp.SUB_DELIMITERS_RE,
+    abnf_regexp.PCT_ENCODED,
+    abnf_regexp.UNRESERVED_RE,
+    abnf_regexp.SUB_DELIMITERS_RE,
+)
 
-SUBAUTHORITY_MATCHER = re.compile(
-    (
+_MATCHER_PATTERNS = {
+    "URI_MATCHER": abnf_regexp.URL_PARSING_RE,
+    "SUBAUTHORITY_MATCHER": (
         "^(?:(?P<userinfo>{})@)?"  # userinfo
         "(?P<host>{})"  # host
         "(?::(?P<port>{}))?$"  # port
     ).format(
         abnf_regexp.USERINFO_RE, abnf_regexp.HOST_PATTERN, abnf_regexp.PORT_RE
-    )
-)
-
-
-HOST_MATCHER = re.compile("^" + abnf_regexp.HOST_RE + "$")
-IPv4_MATCHER = re.compile("^" + abnf_regexp.IPv4_RE + "$")
-IPv6_MATCHER = re.compile(r"^\[" + abnf_regexp.IPv6_ADDRZ_RFC4007_RE + r"\]$")
-
-# Used by host validator
-IPv6_NO_RFC4007_MATCHER = re.compile(r"^\[%s\]$" % (abnf_regexp.IPv6_ADDRZ_RE))
-
-# Matcher used to validate path components
-PATH_MATCHER = re.compile(abnf_regexp.PATH_RE)
-
-
-# ##################################
-# Query and Fragment Matcher Section
-# ##################################
-
-QUERY_MATCHER = re.compile(abnf_regexp.QUERY_RE)
-
-FRAGMENT_MATCHER = QUERY_MATCHER
-
-# Scheme validation, see: http://tools.ietf.org/html/rfc3986#section-3.1
-SCHEME_MATCHER = re.compile(f"^{abnf_regexp.SCHEME_RE}$")
-
-RELATIVE_REF_MATCHER = re.compile(
-    r"^%s(\?%s)?(#%s)?$"
+    ),
+    "HOST_MATCHER": "^" + abnf_regexp.HOST_RE + "$",
+    "IPv4_MATCHER": "^" + abnf_regexp.IPv4_RE + "$",
+    "IPv6_MATCHER": r"^\[" + abnf_regexp.IPv6_ADDRZ_RFC4007_RE + r"\]$",
+    # Used by host validator
+    "IPv6_NO_RFC4007_MATCHER": r"^\[%s\]$" % (abnf_regexp.IPv6_ADDRZ_RE),
+    # Matcher used to validate path components
+    "PATH_MATCHER": abnf_regexp.PATH_RE,
+    # ##################################
+    # Query and Fragment Matcher Section
+    # ##################################
+    "QUERY_MATCHER": abnf_regexp.QUERY_RE,
+    # Scheme validation, see: http://tools.ietf.org/html/rfc3986#section-3.1
+    "SCHEME_MATCHER": f"^{abnf_regexp.SCHEME_RE}$",
+    "RELATIVE_REF_MATCHER": r"^%s(\?%s)?(#%s)?$"
     % (
         abnf_regexp.RELATIVE_PART_RE,
         abnf_regexp.QUERY_RE,
         abnf_regexp.FRAGMENT_RE,
-    )
-)
-
-# See http://tools.ietf.org/html/rfc3986#section-4.3
-ABSOLUTE_URI_MATCHER = re.compile(
-    r"^%s:%s(\?%s)?$"
+    ),
+    # See http://tools.ietf.org/html/rfc3986#section-4.3
+    "ABSOLUTE_URI_MATCHER": r"^%s:%s(\?%s)?$"
     % (
         abnf_regexp.COMPONENT_PATTERN_DICT["scheme"],
         abnf_regexp.HIER_PART_RE,
         abnf_regexp.QUERY_RE[1:-1],
-    )
-)
-
-# ###############
-# IRIs / RFC 3987
-# ###############
-
-IRI_MATCHER = re.compile(abnf_regexp.URL_PARSING_RE, re.UNICODE)
-
-ISUBAUTHORITY_MATCHER = re.compile(
-    (
+    ),
+    "_ABSOLUTE_AUTHORITY_MATCHER": abnf_regexp.COMPONENT_PATTERN_DICT[
+        "authority"
+    ],
+    "_ABSOLUTE_PATH_ABEMPTY_MATCHER": f"(?:/{_PATH_CHARS_RE})?",
+    "_ABSOLUTE_PATH_MATCHER": f"(?!//){_PATH_CHARS_RE}",
+    "_ABSOLUTE_QUERY_MATCHER": _PATH_CHARS_RE.replace("/", "/?"),
+    # Without a scheme component, only a path that starts like "scheme:" can
+    # unsplit to an absolute URI.
+    "_SCHEME_PREFIX_MATCHER": abnf_regexp.SCHEME_RE + ":",
+    # ###############
+    # IRIs / RFC 3987
+    # ###############
+    "IRI_MATCHER": abnf_regexp.URL_PARSING_RE,
+    "ISUBAUTHORITY_MATCHER": (
         "^(?:(?P<userinfo>{})@)?"  # iuserinfo
         "(?P<host>{})"  # ihost
         ":?(?P<port>{})?$"  # port
     ).format(
         abnf_regexp.IUSERINFO_RE, abnf_regexp.IHOST_RE, abnf_regexp.PORT_RE
     ),
-    re.UNICODE,
-)
+}
+
+# Matchers that are the same object as another matcher.
+_MATCHER_ALIASES = {"FRAGMENT_MATCHER": "QUERY_MATCHER"}
+
+
+def __getattr__(name: str) -> t.Pattern[str]:
+    target = _MATCHER_ALIASES.get(name, name)
+    try:
+        pattern = _MATCHER_PATTERNS[target]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    # setdefault keeps the first matcher if two threads compile at once.
+    matcher = globals().setdefault(target, re.compile(pattern))
+    globals()[name] = matcher
+    return matcher
+
+
+def __dir__() -> t.List[str]:
+    names = set(globals()) | set(_MATCHER_PATTERNS) | set(_MATCHER_ALIASES)
+    return sorted(names)
 
 
 # Path merger as defined in http://tools.ietf.org/html/rfc3986#section-5.2.3
@@ -138,3 +183,6 @@ def merge_paths(base_uri: URIReferenceBase, relative_path: str) -> str:
 
 
 UseExisting: t.Final[t.Any] = object()
+
+# The ways batch APIs can handle an item that fails to parse.
+ON_ERROR_POLICIES: t.Final = ("raise", "skip", "yield")
@@ -15,8 +15,8 @@
 
 import re
 import typing as t
-from urllib.parse import quote as urlquote
 
+from . import _ip_literal
 from . import compat
 from . import misc
 
@@ -43,17 +43,21 @@ def normalize_authority(
 
 def normalize_username(username: str) -> str:
     """Normalize a username to make it safe to include in userinfo."""
-    return urlquote(username)
+    from urllib.parse import quote
+
+    return quote(username)
 
 
 def normalize_password(password: str) -> str:
     """Normalize a password to make safe for userinfo."""
-    return urlquote(password)
+    from urllib.parse import quote
+
+    return quote(password)
 
 
 def normalize_host(host: str) -> str:
     """Normalize a host string."""
-    if misc.IPv6_MATCHER.match(host):
+    if _ip_literal.is_ipv6_literal(host):
         percent = host.find("%")
         if percent != -1:
             percent_25 = host.find("%25")
@@ -118,6 +122,13 @@ def normalize_fragment(fragment: t.Optional[str]) -> t.Optional[str]:
 
 
 PERCENT_MATCHER = re.compile("%[A-Fa-f0-9]{2}")
+_PERCENT_MATCHER_BYTES = re.compile(PERCENT_MATCHER.pattern.encode())
+# Percent-encodings with at least one lower-case hexadecimal digit.
+_LOWER_PERCENT_MATCHER = re.compile("%(?:[a-f][A-Fa-f0-9]|[A-F0-9][a-f])")
+
+
+def _upper_match(match: "re.Match[str]") -> str:
+    return match.group().upper()
 
 
 def normalize_percent_characters(s: str) -> str:
@@ -125,11 +136,9 @@ def normalize_percent_characters(s: str) -> str:
 
     For example, ``"%3afoo%DF%ab"`` should be turned into ``"%3Afoo%DF%AB"``.
     """
-    matches = set(PERCENT_MATCHER.findall(s))
-    for m in matches:
-        if not m.isupper():
-            s = s.replace(m, m.upper())
-    return s
+    if "%" not in s:
+        return s
+    return _LOWER_PERCENT_MATCHER.sub(_upper_match, s)
 
 
 def remove_dot_segments(s: str) -> str:
@@ -166,6 +175,43 @@ def remove_dot_segments(s: str) -> str:
     return "/".join(output)
 
 
+# Bytes that never need to be percent-encoded, and the percent-encoded form
+# of every byte value.
+_NON_PCT_ENCODED_BYTES = "".join(sorted(misc.NON_PCT_ENCODED)).encode()
+_PERCENT_ENCODED_BYTES = [f"%{byte:02X}".encode() for byte in range(256)]
+_ENCODE_TABLE = [
+    bytes([byte]) if byte in _NON_PCT_ENCODED_BYTES else pct_encoded
+    for byte, pct_encoded in enumerate(_PERCENT_ENCODED_BYTES)
+]
+_ENCODE_TABLE_KEEP_PERCENT = _ENCODE_TABLE.copy()
+_ENCODE_TABLE_KEEP_PERCENT[ord("%")] = b"%"
+
+
+def _percent_encode(
+    uri_bytes: bytes,
+    unsafe: bytes,
+    percent_encodings: int,
+) -> bytes:
+    """Percent-encode the bytes of a component that need it.
+
+    ``unsafe`` holds the bytes of ``uri_bytes`` that are not always allowed
+    and ``percent_encodings`` is the number of valid percent-encodings
+    already present in the component.
+    """
+    # If every '%' starts a percent-encoding, the component is already
+    # percent-encoded so we can skip all '%' characters but still encode all
+    # others.
+    percent_count = unsafe.count(b"%")
+    if percent_encodings == percent_count:
+        if percent_count == len(unsafe):
+            return uri_bytes
+        table = _ENCODE_TABLE_KEEP_PERCENT
+    else:
+        table = _ENCODE_TABLE
+
+    return b"".join([table[byte] for byte in uri_bytes])
+
+
 @t.overload
 def encode_component(uri_component: None, encoding: str) -> None:  # noqa: D103
     ...
@@ -184,26 +230,38 @@ def encode_component(
     if uri_component is None:
         return uri_component
 
-    # Try to see if the component we're encoding is already percent-encoded
-    # so we can skip all '%' characters but still encode all others.
+    uri_bytes = compat.to_bytes(uri_component, encoding)
+
+    # Delete every byte that is always allowed. If nothing is left, there is
+    # nothing to encode.
+    unsafe = uri_bytes.translate(None, _NON_PCT_ENCODED_BYTES)
+    if not unsafe:
+        return compat.to_str(uri_component, encoding)
+
     percent_encodings = len(
         PERCENT_MATCHER.findall(compat.to_str(uri_component, encoding))
     )
+    encoded_bytes = _percent_encode(uri_bytes, unsafe, percent_encodings)
+    if encoded_bytes is uri_bytes:
+        return compat.to_str(uri_component, encoding)
+    return encoded_bytes.decode(encoding)
 
-    uri_bytes = compat.to_bytes(uri_component, encoding)
-    is_percent_encoded = percent_encodings == uri_bytes.count(b"%")
-
-    encoded_uri = bytearray()
-
-    for i in range(0, len(uri_bytes)):
-        # Will return a single character bytestring on both Python 2 & 3
-        byte = uri_bytes[i : i + 1]
-        byte_ord = ord(byte)
-        if (is_percent_encoded and byte == b"%") or (
-            byte_ord < 128 and byte.decode() in misc.NON_PCT_ENCODED
-        ):
-            encoded_uri.extend(byte)
-            continue
-        encoded_uri.extend(f"%{byte_ord:02x}".encode().upper())
 
-    return encoded_uri.decode(encoding)
+def _encode_ascii_component(
+    uri_component: t.Optional[bytes],
+) -> t.Optional[bytes]:
+    """Encode a component made only of ASCII bytes.
+
+    For such components this returns the same bytes, encoded, as
+    :func:`encode_component` returns characters for any ASCII compatible
+    encoding.
+    """
+    if uri_component is None:
+        return uri_component
+
+    unsafe = uri_component.translate(None, _NON_PCT_ENCODED_BYTES)
+    if not unsafe:
+        return uri_component
+
+    percent_encodings = len(_PERCENT_MATCHER_BYTES.findall(uri_component))
+    return _percent_encode(uri_component, unsafe, percent_encodings)
@@ -13,9 +13,13 @@
 # limitations under the License.
 """Module containing the urlparse compatibility logic."""
 
+import functools
+import re
 import typing as t
 from collections import namedtuple
 
+from . import _ip_literal
+from . import _scanner
 from . import compat
 from . import exceptions
 from . import misc
@@ -36,6 +40,17 @@ PARSED_COMPONENTS = (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _bytes_matcher(name: str) -> t.Pattern[bytes]:
+    """Compile the bytes version of a matcher in :mod:`rfc3986.misc`.
+
+    These are used to parse the authority of pure ASCII bytes without
+    decoding them, and are compiled on first use like the originals.
+    """
+    matcher: t.Pattern[str] = getattr(misc, name)
+    return re.compile(matcher.pattern.encode())
+
+
 class ParseResultMixin(t.Generic[t.AnyStr]):
     if t.TYPE_CHECKING:
         userinfo: t.Optional[t.AnyStr]
@@ -289,8 +304,9 @@ class ParseResultBytes(
     query: t.Optional[bytes]
     fragment: t.Optional[bytes]
     encoding: str
-    reference: "uri.URIReference"
     lazy_normalize: bool
+    _reference: t.Optional["uri.URIReference"]
+    _components: "_scanner._BytesComponents"
 
     def __new__(
         cls,
@@ -301,7 +317,7 @@ class ParseResultBytes(
         path: t.Optional[bytes],
         query: t.Optional[bytes],
         fragment: t.Optional[bytes],
-        uri_ref: "uri.URIReference",
+        uri_ref: t.Optional["uri.URIReference"],
         encoding: str = "utf-8",
         lazy_normalize: bool = True,
     ) -> _Self:
@@ -317,10 +333,26 @@ class ParseResultBytes(
             fragment or None,
         )
         parse_result.encoding = encoding
-        parse_result.reference = uri_ref
+        parse_result._reference = uri_ref
         parse_result.lazy_normalize = lazy_normalize
         return parse_result
 
+    @property
+    def reference(self) -> "uri.URIReference":
+        """The :class:`~rfc3986.uri.URIReference` behind this result."""
+        reference = self._reference
+        if reference is None:
+            # Results parsed straight from ASCII bytes only build their
+            # reference when something needs it.
+            scheme, authority, path, query, fragment = (
+                compat.to_str(component, self.encoding)
+                for component in self._components
+            )
+            reference = self._reference = uri.URIReference(
+                scheme, authority, path, query, fragment, self.encoding
+            )
+        return reference
+
     @classmethod
     def from_parts(
         cls,
@@ -377,6 +409,10 @@ class ParseResultBytes(
     ) -> _Self:
         """Parse a URI from the given unicode URI string.
 
+        If ``uri_string`` is pure ASCII :class:`bytes` (or a
+        :class:`memoryview` of them) and ``encoding`` is ASCII compatible, it
+        is parsed without being decoded to :class:`str` first.
+
         :param str uri_string: Unicode URI to be parsed into a reference.
         :param str encoding: The encoding of the string provided
         :param bool strict: Parse strictly according to :rfc:`3986` if True.
@@ -384,6 +420,18 @@ class ParseResultBytes(
             function.
         :returns: :class:`ParseResultBytes` or subclass thereof
         """
+        if isinstance(uri_string, memoryview):
+            uri_string = uri_string.tobytes()
+        if (
+            lazy_normalize
+            and isinstance(uri_string, bytes)
+            and uri_string.isascii()
+            and _is_ascii_compatible(encoding)
+        ):
+            parse_result = cls._from_ascii_bytes(uri_string, encoding)
+            if parse_result is not None:
+                return parse_result
+
         reference = uri.URIReference.from_string(uri_string, encoding)
         if not lazy_normalize:
             reference = reference.normalize()
@@ -403,9 +451,66 @@ class ParseResultBytes(
             lazy_normalize=lazy_normalize,
         )
 
+    @classmethod
+    def _from_ascii_bytes(
+        cls,
+        uri_bytes: bytes,
+        encoding: str,
+    ) -> t.Optional[_Self]:
+        """Parse pure ASCII bytes, or return None if the authority is bad.
+
+        Invalid authorities are left to :meth:`from_string` so that they are
+        reported (or split leniently) exactly as before.
+        """
+        scheme, authority, path, query, fragment = _scanner.split_bytes(
+            uri_bytes
+        )
+        encode = normalizers._encode_ascii_component
+        path = encode(path)
+        query = encode(query)
+        fragment = encode(fragment)
+
+        userinfo = host = port = None
+        if authority and b"[" in authority:
+            parts = _ip_literal.split_authority(authority.decode("ascii"))
+            if parts is None:
+                return None
+            userinfo, host, port = (
+                None if part is None else part.encode() for part in parts
+            )
+        elif authority:
+            match = _bytes_matcher("SUBAUTHORITY_MATCHER").match(authority)
+            if match is None:
+                return None
+            userinfo, host, port = match.group("userinfo", "host", "port")
+            if (
+                host
+                and _bytes_matcher("IPv4_MATCHER").match(host)
+                and not all(0 <= int(byte) <= 255 for byte in host.split(b"."))
+            ):
+                return None
+
+        parse_result = cls(
+            scheme=scheme,
+            userinfo=userinfo,
+            host=host,
+            port=int(port) if port else None,
+            path=path,
+            query=query,
+            fragment=fragment,
+            uri_ref=None,
+            encoding=encoding,
+        )
+        parse_result._components = (scheme, authority, path, query, fragment)
+        return parse_result
+
     @property
     def authority(self) -> bytes:
         """Return the normalized authority."""
+        if self._reference is None:
+            authority = self._components[1]
+            if authority:
+                return authority
         return self.reference.authority.encode(self.encoding)
 
     def copy_with(
@@ -472,6 +577,20 @@ class ParseResultBytes(
         return uri.encode(self.encoding)
 
 
+@functools.lru_cache(maxsize=None)
+def _is_ascii_compatible(encoding: str) -> bool:
+    """Determine if ASCII text is encoded the same way in ``encoding``."""
+    ascii_bytes = bytes(range(128))
+    ascii_text = ascii_bytes.decode("ascii")
+    try:
+        return (
+            ascii_bytes.decode(encoding) == ascii_text
+            and ascii_text.encode(encoding) == ascii_bytes
+        )
+    except (LookupError, UnicodeError):
+        return False
+
+
 def split_authority(
     authority: str,
 ) -> t.Tuple[t.Optional[str], t.Optional[str], t.Optional[str]]:
@@ -518,9 +637,17 @@ def authority_from(
         host = subauthority.get("host")
         port = subauthority.get("port")
 
-    if port:
-        if port.isascii() and port.isdigit():
-            port = int(port)
-        else:
-            raise exceptions.InvalidPort(port)
-    return userinfo, host, port
+    return userinfo, host, port_number(port)
+
+
+def port_number(port: t.Optional[str]) -> t.Optional[int]:
+    """Convert a port from an authority to an integer.
+
+    :raises rfc3986.exceptions.InvalidPort:
+        If the port is not made of ASCII digits.
+    """
+    if not port:
+        return None
+    if port.isascii() and port.isdigit():
+        return int(port)
+    raise exceptions.InvalidPort(port)
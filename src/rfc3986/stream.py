@@ -0,0 +1,161 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Module containing functions to normalize files of URIs.
+
+Example usage::
+
+    >>> from rfc3986 import stream
+    >>> for uri in stream.normalize_lines('urls.txt'):
+    ...     print(uri)
+
+"""
+
+import contextlib
+import mmap
+import os
+import typing as t
+
+from . import misc
+from . import uri
+
+__all__ = ("normalize_lines",)
+
+#: How many bytes (or characters, for text files) are read between calls to
+#: the ``progress`` callback of :func:`normalize_lines`.
+PROGRESS_INTERVAL = 1 << 20
+
+_Line = t.Union[str, bytes]
+_Source = t.Union[str, "os.PathLike[str]", t.IO[bytes], t.IO[str]]
+_Progress = t.Callable[[int, t.Optional[int]], None]
+
+
+def normalize_lines(
+    source: _Source,
+    encoding: str = "utf-8",
+    on_error: str = "raise",
+    progress: t.Optional[_Progress] = None,
+) -> t.Iterator[t.Union[str, Exception]]:
+    """Lazily normalize a file with one URI per line.
+
+    When ``source`` is a path, the file is memory-mapped, so only the pages
+    being read are held in memory. Open file objects, binary or text, are
+    read line by line through their own buffering. Either way, memory use
+    does not grow with the size of the file.
+
+    Each line, without its line ending, is normalized like
+    :func:`~rfc3986.api.normalize_uri` does, and one string is produced for
+    every line.
+
+    .. versionadded:: 2.1.0
+
+    :param source: A path, or a file object opened for reading.
+    :param str encoding: The encoding of the file
+    :param str on_error: What to do when a line cannot be parsed.
+        ``"raise"`` (the default) raises the exception, ``"skip"`` drops
+        the line, and ``"yield"`` yields the exception in place of the
+        normalized URI.
+    :param progress: (optional) Called with the number of bytes read so far
+        and the size of the file (or ``None`` when it is not known) about
+        every :data:`PROGRESS_INTERVAL` bytes and once at the end.
+    :returns: Iterator of normalized URIs
+    :raises ValueError: If ``on_error`` is not one of the values above.
+    """
+    if on_error not in misc.ON_ERROR_POLICIES:
+        raise ValueError(
+            f"on_error must be one of {misc.ON_ERROR_POLICIES!r}, "
+            f"not {on_error!r}"
+        )
+    return _normalize_lines(source, encoding, on_error, progress)
+
+
+def _normalize_lines(
+    source: _Source,
+    encoding: str,
+    on_error: str,
+    progress: t.Optional[_Progress],
+) -> t.Iterator[t.Union[str, Exception]]:
+    from_string = uri.URIReference.from_string
+    raise_errors = on_error == "raise"
+    yield_errors = on_error == "yield"
+
+    with _open_lines(source) as (lines, total):
+        position = 0
+        next_report = PROGRESS_INTERVAL
+        for line, position in lines:
+            if progress is not None and position >= next_report:
+                progress(position, total)
+                next_report = position + PROGRESS_INTERVAL
+            try:
+                normalized = from_string(line, encoding).normalize().unsplit()
+            except (TypeError, ValueError) as error:
+                if raise_errors:
+                    raise
+                if yield_errors:
+                    yield error
+                continue
+            yield normalized
+        if progress is not None:
+            progress(position, total)
+
+
+@contextlib.contextmanager
+def _open_lines(
+    source: _Source,
+) -> t.Iterator[t.Tuple[t.Iterator[t.Tuple[_Line, int]], t.Optional[int]]]:
+    """Produce ``(line, position)`` pairs and the size of the source."""
+    if not isinstance(source, (str, os.PathLike)):
+        yield _iter_file_lines(source), None
+        return
+
+    with open(source, "rb") as file:
+        try:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Empty files and special files such as pipes cannot be mapped.
+            yield _iter_file_lines(file), os.fstat(file.fileno()).st_size
+            return
+        with mapped:
+            yield _iter_mapped_lines(mapped), len(mapped)
+
+
+def _iter_mapped_lines(
+    mapped: mmap.mmap,
+) -> t.Iterator[t.Tuple[bytes, int]]:
+    size = len(mapped)
+    start = 0
+    while start < size:
+        end = mapped.find(b"\n", start)
+        if end == -1:
+            end = size
+        yield _strip_line_ending(mapped[start:end]), min(end + 1, size)
+        start = end + 1
+
+
+def _iter_file_lines(
+    file: t.Union[t.IO[bytes], t.IO[str]],
+) -> t.Iterator[t.Tuple[_Line, int]]:
+    position = 0
+    for line in file:
+        position += len(line)
+        yield _strip_line_ending(line), position
+
+
+_LineT = t.TypeVar("_LineT", str, bytes)
+
+
+def _strip_line_ending(line: _LineT) -> _LineT:
+    if line[-1:] in ("\n", b"\n"):
+        line = line[:-1]
+    if line[-1:] in ("\r", b"\r"):
+        line = line[:-1]
+    return line
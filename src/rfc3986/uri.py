@@ -16,12 +16,25 @@
 # limitations under the License.
 import typing as t
 
+from . import _scanner
+from . import cache
 from . import compat
 from . import misc
 from . import normalizers
+from ._mixin import Resolver as Resolver  # noqa: F401
 from ._mixin import URIMixin
 from ._typing_compat import Self as _Self
 
+#: The normalized scheme, authority, path, query, and fragment of a
+#: reference, as returned by :meth:`URIReference.canonical_key`.
+CanonicalKey = t.Tuple[
+    t.Optional[str],
+    t.Optional[str],
+    t.Optional[str],
+    t.Optional[str],
+    t.Optional[str],
+]
+
 
 class URIReference(misc.URIReferenceBase, URIMixin):
     """Immutable object representing a parsed URI Reference.
@@ -81,7 +94,13 @@ class URIReference(misc.URIReferenceBase, URIMixin):
         The port parsed from the authority.
     """
 
-    encoding: str
+    # Only references with another encoding store one, so that references
+    # that are just parsed and read never allocate an instance dictionary.
+    encoding: str = "utf-8"
+    _normalized: "URIReference"
+    _is_normalized: bool
+    _canonical_key: "CanonicalKey"
+    _known_equal_strings: t.Tuple[str, ...]
 
     def __new__(
         cls,
@@ -101,17 +120,43 @@ class URIReference(misc.URIReferenceBase, URIMixin):
             query,
             fragment,
         )
-        ref.encoding = encoding
+        if encoding != ref.encoding:
+            ref.encoding = encoding
         return ref
 
     __hash__ = tuple.__hash__
 
+    def __getstate__(self) -> t.Optional[t.Dict[str, str]]:
+        """Pickle the encoding, if it is not the default, but no caches."""
+        if self.encoding == type(self).encoding:
+            return None
+        return {"encoding": self.encoding}
+
+    def _replace(self, **kwargs: t.Any) -> _Self:
+        """Replace components, keeping a non-default encoding."""
+        ref = super()._replace(**kwargs)
+        if ref.encoding != self.encoding:
+            ref.encoding = self.encoding
+        return ref
+
     def __eq__(self, other: object) -> bool:
         """Compare this reference to another."""
+        if isinstance(other, str) and other in self._equal_strings():
+            return True
         other_ref = other
         if isinstance(other, tuple):
             other_ref = type(self)(*other)
-        elif not isinstance(other, URIReference):
+        elif isinstance(other, URIMixin):
+            # Such as a URIView, which has the same components.
+            other_ref = type(self)(
+                other.scheme,
+                other.authority,
+                other.path,
+                other.query,
+                other.fragment,
+                other.encoding,
+            )
+        else:
             try:
                 other_ref = self.from_string(other)
             except TypeError:
@@ -121,22 +166,54 @@ class URIReference(misc.URIReferenceBase, URIMixin):
                     )
                 )
 
+        return self._equals_reference(t.cast(URIReference, other_ref))
+
+    def _equals_reference(self, other_ref: "URIReference") -> bool:
         # See http://tools.ietf.org/html/rfc3986#section-6.2
         naive_equality = tuple(self) == tuple(other_ref)
         return naive_equality or self.normalized_equality(other_ref)
 
+    def _equal_strings(self) -> t.Tuple[str, ...]:
+        # Comparing against the string this reference or its normal form
+        # unsplits to is common, so those strings are checked once, the slow
+        # way, and remembered. Neither is guaranteed to parse back to an
+        # equal reference, e.g. a path of "//a" without an authority.
+        try:
+            return self._known_equal_strings
+        except AttributeError:
+            pass
+        candidates = {self.unsplit(), self.normalize().unsplit()}
+        known = tuple(
+            candidate
+            for candidate in candidates
+            if self._equals_reference(self.from_string(candidate))
+        )
+        self._known_equal_strings = known
+        return known
+
     def normalize(self) -> "URIReference":
         """Normalize this reference as described in Section 6.2.2.
 
         This is not an in-place normalization. Instead this creates a new
         URIReference.
 
+        The result is remembered, so normalizing the same reference again is
+        cheap. A reference returned by this method is already normalized and
+        returns itself.
+
         :returns: A new reference object with normalized components.
         :rtype: URIReference
         """
+        if getattr(self, "_is_normalized", False):
+            return self
+        try:
+            return self._normalized
+        except AttributeError:
+            pass
+
         # See http://tools.ietf.org/html/rfc3986#section-6.2.2 for logic in
         # this method.
-        return URIReference(
+        normalized = URIReference(
             normalizers.normalize_scheme(self.scheme or ""),
             normalizers.normalize_authority(
                 (self.userinfo, self.host, self.port)
@@ -146,6 +223,32 @@ class URIReference(misc.URIReferenceBase, URIMixin):
             normalizers.normalize_fragment(self.fragment),
             self.encoding,
         )
+        # Normalization is idempotent, so the new reference is its own normal
+        # form. A flag avoids a reference cycle through _normalized.
+        normalized._is_normalized = True
+        self._normalized = normalized
+        return normalized
+
+    def canonical_key(self) -> CanonicalKey:
+        """Return the components of this reference in normal form.
+
+        Two references compare equal exactly when their canonical keys are
+        equal, so the key can be used to deduplicate references in sets and
+        dictionaries. It is computed once and remembered.
+
+        .. versionadded:: 2.1.0
+
+        :returns: The normalized scheme, authority, path, query, and
+            fragment.
+        :rtype: tuple
+        """
+        try:
+            return self._canonical_key
+        except AttributeError:
+            pass
+        key = t.cast(CanonicalKey, tuple(self.normalize()))
+        self._canonical_key = key
+        return key
 
     @classmethod
     def from_string(
@@ -159,14 +262,138 @@ class URIReference(misc.URIReferenceBase, URIMixin):
         :param str encoding: The encoding of the string provided
         :returns: :class:`URIReference` or subclass thereof
         """
+        if cache.parse_cache.maxsize and isinstance(uri_string, (str, bytes)):
+            key = (uri_string, encoding, cls)
+            reference = cache.parse_cache.get(key)
+            if reference is None:
+                reference = cls._from_string(uri_string, encoding)
+                cache.parse_cache.put(key, reference)
+            return reference
+        return cls._from_string(uri_string, encoding)
+
+    @classmethod
+    def _from_string(
+        cls,
+        uri_string: t.Union[str, bytes],
+        encoding: str,
+    ) -> _Self:
         uri_string = compat.to_str(uri_string, encoding)
 
-        split_uri = misc.URI_MATCHER.match(uri_string).groupdict()
+        scheme, authority, path, query, fragment = _scanner.split(uri_string)
         return cls(
-            split_uri["scheme"],
-            split_uri["authority"],
-            normalizers.encode_component(split_uri["path"], encoding),
-            normalizers.encode_component(split_uri["query"], encoding),
-            normalizers.encode_component(split_uri["fragment"], encoding),
+            scheme,
+            authority,
+            normalizers.encode_component(path, encoding),
+            normalizers.encode_component(query, encoding),
+            normalizers.encode_component(fragment, encoding),
             encoding,
         )
+
+    @t.overload
+    @classmethod
+    def from_strings(  # noqa: D102
+        cls,
+        uri_strings: t.Iterable[t.Union[str, bytes]],
+        encoding: str = ...,
+        on_error: t.Literal["raise", "skip"] = ...,
+    ) -> t.Iterator[_Self]: ...
+
+    @t.overload
+    @classmethod
+    def from_strings(  # noqa: D102
+        cls,
+        uri_strings: t.Iterable[t.Union[str, bytes]],
+        encoding: str = ...,
+        *,
+        on_error: t.Literal["yield"],
+    ) -> t.Iterator[t.Union[_Self, Exception]]: ...
+
+    @classmethod
+    def from_strings(
+        cls,
+        uri_strings: t.Iterable[t.Union[str, bytes]],
+        encoding: str = "utf-8",
+        on_error: str = "raise",
+    ) -> t.Iterator[t.Union[_Self, Exception]]:
+        """Lazily parse many URI references from an iterable of strings.
+
+        This produces the same references as calling :meth:`from_string` on
+        each item, but binds everything it needs once for the whole batch.
+
+        .. versionadded:: 2.1.0
+
+        :param uri_strings: Iterable of unicode or bytes URIs.
+        :param str encoding: The encoding of the strings provided
+        :param str on_error: What to do when an item cannot be parsed.
+            ``"raise"`` (the default) raises the exception, ``"skip"`` drops
+            the item, and ``"yield"`` yields the exception in place of the
+            reference.
+        :returns: Iterator of :class:`URIReference` or subclass thereof
+        :raises ValueError: If ``on_error`` is not one of the values above.
+        """
+        if on_error not in misc.ON_ERROR_POLICIES:
+            raise ValueError(
+                f"on_error must be one of {misc.ON_ERROR_POLICIES!r}, "
+                f"not {on_error!r}"
+            )
+        return cls._iter_from_strings(uri_strings, encoding, on_error)
+
+    @classmethod
+    def _iter_from_strings(
+        cls,
+        uri_strings: t.Iterable[t.Union[str, bytes]],
+        encoding: str,
+        on_error: str,
+    ) -> t.Iterator[t.Union[_Self, Exception]]:
+        from_string = cls._from_string
+        raise_errors = on_error == "raise"
+        yield_errors = on_error == "yield"
+
+        for uri_string in uri_strings:
+            try:
+                reference = from_string(uri_string, encoding)
+            except (TypeError, ValueError) as error:
+                if raise_errors:
+                    raise
+                if yield_errors:
+                    yield error
+                continue
+            yield reference
+
+
+class CanonicalURI(URIReference):
+    """A URI reference that hashes and compares by its canonical key.
+
+    :class:`URIReference` hashes its components as they were written but
+    compares them after normalization, so two references that are equal
+    may hash differently. This subclass hashes
+    :meth:`~URIReference.canonical_key` instead, which makes it safe to use
+    in sets and as a dictionary key:
+
+    .. code-block:: python
+
+        >>> from rfc3986.uri import CanonicalURI
+        >>> seen = {CanonicalURI.from_string("HTTP://Example.com/%7euser")}
+        >>> CanonicalURI.from_string("http://example.com/%7Euser") in seen
+        True
+
+    Mixing instances of this class with plain :class:`URIReference`
+    objects in the same set or dictionary is not supported, because their
+    hashes differ.
+
+    .. versionadded:: 2.1.0
+    """
+
+    def __hash__(self) -> int:
+        """Hash the canonical key of this reference."""
+        return hash(self.canonical_key())
+
+    def __eq__(self, other: object) -> bool:
+        """Compare the canonical keys of this reference and another."""
+        if isinstance(other, URIReference):
+            return self.canonical_key() == other.canonical_key()
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        """Compare the canonical keys of this reference and another."""
+        return not self == other
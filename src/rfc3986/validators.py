@@ -15,12 +15,15 @@
 
 import typing as t
 
+from . import _ip_literal
 from . import exceptions
 from . import misc
 from . import normalizers
-from . import uri
 from ._typing_compat import Self as _Self
 
+if t.TYPE_CHECKING:
+    from . import uri
+
 
 class Validator:
     """Object used to configure validation of all objects in rfc3986.
@@ -235,6 +238,45 @@ class Validator:
         ensure_one_of(self.allowed_hosts, uri, "host")
         ensure_one_of(self.allowed_ports, uri, "port")
 
+    def compile(self) -> t.Callable[["uri.URIReference"], None]:
+        """Freeze this validator into a function that validates a URI.
+
+        The returned function performs the same checks and raises the same
+        exceptions as :meth:`validate`, but everything that does not depend
+        on the URI is worked out once, here. Later changes to this validator
+        do not affect functions it has already compiled.
+
+        .. versionadded:: 2.1.0
+
+        :returns:
+            A function that takes a
+            :class:`~rfc3986.uri.URIReference` and returns ``None``.
+        :rtype:
+            callable
+        """
+        return _compile(
+            self.allow_password,
+            tuple(
+                component
+                for component, required in self.required_components.items()
+                if required
+            ),
+            tuple(
+                component
+                for component, validated in self.validated_components.items()
+                if validated
+            ),
+            tuple(
+                (component, frozenset(allowed))
+                for component, allowed in (
+                    ("scheme", self.allowed_schemes),
+                    ("host", self.allowed_hosts),
+                    ("port", self.allowed_ports),
+                )
+                if allowed
+            ),
+        )
+
 
 def check_password(uri: "uri.URIReference") -> None:
     """Assert that there is no password present in the uri."""
@@ -315,7 +357,10 @@ def authority_is_valid(
     :rtype:
         bool
     """
-    validated = is_valid(authority, misc.SUBAUTHORITY_MATCHER, require)
+    if authority is not None and "[" in authority:
+        validated = _ip_literal.split_authority(authority) is not None
+    else:
+        validated = is_valid(authority, misc.SUBAUTHORITY_MATCHER, require)
     if validated and host is not None:
         return host_is_valid(host, require)
     return validated
@@ -333,11 +378,12 @@ def host_is_valid(host: t.Optional[str], require: bool = False) -> bool:
     :rtype:
         bool
     """
+    if host is not None and host.startswith("["):
+        # Zone IDs must use the RFC 6874 delimiter here.
+        return _ip_literal.is_ip_literal(host, rfc4007=False)
     validated = is_valid(host, misc.HOST_MATCHER, require)
     if validated and host is not None and misc.IPv4_MATCHER.match(host):
         return valid_ipv4_host_address(host)
-    elif validated and host is not None and misc.IPv6_MATCHER.match(host):
-        return misc.IPv6_NO_RFC4007_MATCHER.match(host) is not None
     return validated
 
 
@@ -475,3 +521,55 @@ def ensure_components_are_valid(
 
     if invalid_components:
         raise exceptions.InvalidComponentsError(uri, *invalid_components)
+
+
+def _component_check(
+    component: str,
+) -> t.Callable[["uri.URIReference"], bool]:
+    if component in _SUBAUTHORITY_VALIDATORS:
+        return lambda uri: subauthority_component_is_valid(uri, component)
+    validator = _COMPONENT_VALIDATORS[component]
+    return lambda uri: validator(getattr(uri, component))
+
+
+def _compile(
+    allow_password: bool,
+    required_components: t.Tuple[str, ...],
+    validated_components: t.Tuple[str, ...],
+    allowed_values: t.Tuple[t.Tuple[str, t.FrozenSet[str]], ...],
+) -> t.Callable[["uri.URIReference"], None]:
+    """Build the function returned by :meth:`Validator.compile`."""
+    checks = tuple(
+        (component, _component_check(component))
+        for component in validated_components
+    )
+
+    def validate(uri: "uri.URIReference") -> None:
+        if not allow_password:
+            check_password(uri)
+
+        missing_components = [
+            component
+            for component in required_components
+            if getattr(uri, component) is None
+        ]
+        if missing_components:
+            raise exceptions.MissingComponentError(
+                uri, *sorted(missing_components)
+            )
+
+        invalid_components = [
+            component for component, check in checks if not check(uri)
+        ]
+        if invalid_components:
+            raise exceptions.InvalidComponentsError(uri, *invalid_components)
+
+        for attribute, allowed in allowed_values:
+            value = getattr(uri, attribute)
+            if value is not None and value not in allowed:
+                # validate() reports the validator's own set, not a frozenset.
+                raise exceptions.UnpermittedComponentError(
+                    attribute, value, set(allowed)
+                )
+
+    return validate
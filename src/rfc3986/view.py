@@ -0,0 +1,249 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or
+# implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Module containing a compact, read-only view of a URI reference.
+
+Example usage::
+
+    >>> from rfc3986 import view
+    >>> ref = view.URIView.from_string('https://github.com/python-hyper')
+    >>> ref.host, ref.path
+    ('github.com', '/python-hyper')
+
+"""
+
+import typing as t
+
+from . import _scanner
+from . import compat
+from . import misc
+from . import normalizers
+from . import uri
+from ._mixin import URIMixin
+
+__all__ = ("URIView",)
+
+
+class URIView(URIMixin):
+    """Read-only URI reference that slices its components out of one string.
+
+    A :class:`~rfc3986.uri.URIReference` holds a string for every component
+    and an attribute dictionary. A view holds the (percent-encoded) URI and
+    the offsets at which its components end, and slices a component out of
+    it every time it is accessed. This makes it much smaller, at the cost of
+    slower attribute access.
+
+    Views have the same components, properties, and read-only methods as
+    :class:`~rfc3986.uri.URIReference`. Methods that build a new reference,
+    such as :meth:`copy_with`, :meth:`normalize`, and :meth:`resolve_with`,
+    return a :class:`~rfc3986.uri.URIReference`.
+
+    .. versionadded:: 2.1.0
+    """
+
+    __slots__ = (
+        "_uri",
+        "_scheme_end",
+        "_authority_end",
+        "_path_end",
+        "_query_end",
+        "_cached_authority_info",
+        "encoding",
+    )
+
+    _uri: str
+    _scheme_end: int
+    _authority_end: int
+    _path_end: int
+    _query_end: int
+
+    @classmethod
+    def from_string(
+        cls,
+        uri_string: t.Union[str, bytes],
+        encoding: str = "utf-8",
+    ) -> "URIView":
+        """Parse a URI reference from the given unicode URI string.
+
+        The components are the same as those of
+        :meth:`URIReference.from_string
+        <rfc3986.uri.URIReference.from_string>`.
+
+        :param str uri_string: Unicode URI to be parsed into a reference.
+        :param str encoding: The encoding of the string provided
+        :returns: :class:`URIView` or subclass thereof
+        """
+        uri_string = compat.to_str(uri_string, encoding)
+        scheme, authority, path, query, fragment = _scanner.split(uri_string)
+        encoded_path = normalizers.encode_component(path, encoding)
+        encoded_query = normalizers.encode_component(query, encoding)
+        encoded_fragment = normalizers.encode_component(fragment, encoding)
+        if (encoded_path, encoded_query, encoded_fragment) != (
+            path,
+            query,
+            fragment,
+        ):
+            path, query, fragment = (
+                encoded_path,
+                encoded_query,
+                encoded_fragment,
+            )
+            uri_string = _join(scheme, authority, path, query, fragment)
+
+        view = super().__new__(cls)
+        view._uri = uri_string
+        view.encoding = encoding
+        position = view._scheme_end = -1 if scheme is None else len(scheme)
+        position += 1
+        if authority is None:
+            view._authority_end = -1
+        else:
+            position = view._authority_end = position + 2 + len(authority)
+        position = view._path_end = position + len(path)
+        if query is not None:
+            position += 1 + len(query)
+        view._query_end = position
+        return view
+
+    @property
+    def scheme(self) -> t.Optional[str]:
+        """The scheme, or ``None``."""
+        if self._scheme_end < 0:
+            return None
+        return self._uri[: self._scheme_end]
+
+    @property
+    def authority(self) -> t.Optional[str]:
+        """The authority, or ``None``."""
+        if self._authority_end < 0:
+            return None
+        start = self._scheme_end + 3
+        return self._uri[start : self._authority_end] or None
+
+    @property
+    def path(self) -> t.Optional[str]:
+        """The path, or ``None``."""
+        start = self._authority_end
+        if start < 0:
+            start = self._scheme_end + 1
+        return self._uri[start : self._path_end] or None
+
+    @property
+    def query(self) -> t.Optional[str]:
+        """The query, or ``None``."""
+        if self._query_end == self._path_end:
+            return None
+        return self._uri[self._path_end + 1 : self._query_end]
+
+    @property
+    def fragment(self) -> t.Optional[str]:
+        """The fragment, or ``None``."""
+        if self._query_end == len(self._uri):
+            return None
+        return self._uri[self._query_end + 1 :]
+
+    def __repr__(self) -> str:
+        """Represent the view like a :class:`~rfc3986.uri.URIReference`."""
+        return (
+            f"{type(self).__name__}(scheme={self.scheme!r}, "
+            f"authority={self.authority!r}, path={self.path!r}, "
+            f"query={self.query!r}, fragment={self.fragment!r})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Compare this view to a reference, view, tuple, or string."""
+        if isinstance(other, URIView):
+            other = other.to_reference()
+        return self.to_reference() == other
+
+    def __hash__(self) -> int:
+        """Hash the view like the equivalent URIReference."""
+        return hash(
+            (self.scheme, self.authority, self.path, self.query, self.fragment)
+        )
+
+    def to_reference(self) -> "uri.URIReference":
+        """Create the equivalent :class:`~rfc3986.uri.URIReference`.
+
+        :returns: A new reference with the same components.
+        :rtype: :class:`~rfc3986.uri.URIReference`
+        """
+        return uri.URIReference(
+            self.scheme,
+            self.authority,
+            self.path,
+            self.query,
+            self.fragment,
+            self.encoding,
+        )
+
+    def normalize(self) -> "uri.URIReference":
+        """Normalize this view as described in Section 6.2.2.
+
+        :returns: A new reference object with normalized components.
+        :rtype: :class:`~rfc3986.uri.URIReference`
+        """
+        return self.to_reference().normalize()
+
+    def unsplit(self) -> str:
+        """Create a URI string from the components.
+
+        :returns: The URI Reference reconstituted as a string.
+        :rtype: str
+        """
+        if self._authority_end >= 0 and self.authority is None:
+            # An empty authority is dropped, as URIReference does.
+            return self._join_components()
+        return self._uri
+
+    def copy_with(
+        self,
+        scheme: t.Optional[str] = misc.UseExisting,
+        authority: t.Optional[str] = misc.UseExisting,
+        path: t.Optional[str] = misc.UseExisting,
+        query: t.Optional[str] = misc.UseExisting,
+        fragment: t.Optional[str] = misc.UseExisting,
+    ) -> "uri.URIReference":
+        """Create a :class:`~rfc3986.uri.URIReference` with new components.
+
+        :returns:
+            New URIReference with provided components.
+        :rtype:
+            URIReference
+        """
+        return self.to_reference().copy_with(
+            scheme=scheme,
+            authority=authority,
+            path=path,
+            query=query,
+            fragment=fragment,
+        )
+
+
+def _join(
+    scheme: t.Optional[str],
+    authority: t.Optional[str],
+    path: str,
+    query: t.Optional[str],
+    fragment: t.Optional[str],
+) -> str:
+    parts = []
+    if scheme is not None:
+        parts.extend([scheme, ":"])
+    if authority is not None:
+        parts.extend(["//", authority])
+    parts.append(path)
+    if query is not None:
+        parts.extend(["?", query])
+    if fragment is not None:
+        parts.extend(["#", fragment])
+    return "".join(parts)
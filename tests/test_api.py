@@ -1,6 +1,9 @@
+import pytest
+
 from rfc3986.api import URIReference
 from rfc3986.api import is_valid_uri
 from rfc3986.api import normalize_uri
+from rfc3986.api import parse_many
 from rfc3986.api import uri_reference
 
 
@@ -14,3 +17,36 @@ def test_is_valid_uri():
 
 def test_normalize_uri():
     assert normalize_uri("HTTP://EXAMPLE.COM") == "http://example.com"
+
+
+def test_parse_many():
+    uris = ["http://example.com", b"https://example.org/path?q#f", "/a/b"]
+    references = parse_many(uris)
+    assert not isinstance(references, list)
+    assert list(references) == [uri_reference(uri) for uri in uris]
+
+
+@pytest.mark.parametrize(
+    ["on_error", "expected_length"], [("skip", 2), ("yield", 3)]
+)
+def test_parse_many_on_error(on_error, expected_length):
+    references = list(
+        parse_many(["http://a", b"http://\xff", "http://b"], on_error=on_error)
+    )
+    assert len(references) == expected_length
+    assert references[0] == "http://a"
+    assert references[-1] == "http://b"
+    if on_error == "yield":
+        assert isinstance(references[1], UnicodeDecodeError)
+
+
+def test_parse_many_raises_by_default():
+    references = parse_many(["http://a", b"http://\xff"])
+    assert next(references) == "http://a"
+    with pytest.raises(UnicodeDecodeError):
+        next(references)
+
+
+def test_parse_many_rejects_unknown_on_error():
+    with pytest.raises(ValueError):
+        parse_many([], on_error="ignore")
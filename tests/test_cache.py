@@ -0,0 +1,102 @@
+import threading
+
+import pytest
+
+from rfc3986 import cache
+from rfc3986 import iri_reference
+from rfc3986 import uri_reference
+from rfc3986.iri import IRIReference
+from rfc3986.uri import URIReference
+
+
+@pytest.fixture
+def parse_cache():
+    cache.parse_cache.resize(2)
+    cache.parse_cache.cache_clear()
+    yield cache.parse_cache
+    cache.parse_cache.resize(0)
+    cache.parse_cache.cache_clear()
+
+
+def test_parse_cache_is_disabled_by_default():
+    assert cache.parse_cache.maxsize == 0
+    assert uri_reference("http://a") is not uri_reference("http://a")
+    assert cache.parse_cache.cache_info().currsize == 0
+
+
+def test_disabled_parse_cache_stores_nothing():
+    disabled = cache.ParseCache()
+    disabled.put("key", "value")
+    assert disabled.get("key") is None
+    assert disabled.cache_info() == cache.CacheInfo(
+        hits=0, misses=1, evictions=0, maxsize=0, currsize=0
+    )
+
+
+def test_parse_cache_shares_references(parse_cache):
+    first = uri_reference("http://example.com")
+    assert uri_reference("http://example.com") is first
+    assert parse_cache.cache_info() == cache.CacheInfo(
+        hits=1, misses=1, evictions=0, maxsize=2, currsize=1
+    )
+
+
+def test_parse_cache_keys_on_class_and_encoding(parse_cache):
+    uri = uri_reference("http://example.com")
+    iri = iri_reference("http://example.com")
+    assert type(uri) is URIReference
+    assert type(iri) is IRIReference
+    latin1 = URIReference.from_string("http://example.com", "latin-1")
+    assert latin1.encoding == "latin-1"
+    assert parse_cache.cache_info().evictions == 1
+
+
+def test_parse_cache_evicts_least_recently_used(parse_cache):
+    a = uri_reference("http://a")
+    uri_reference("http://b")
+    assert uri_reference("http://a") is a
+    uri_reference("http://c")
+    assert parse_cache.cache_info().evictions == 1
+    assert uri_reference("http://a") is a
+    assert parse_cache.cache_info().hits == 2
+
+
+def test_parse_cache_resize_evicts(parse_cache):
+    uri_reference("http://a")
+    uri_reference("http://b")
+    parse_cache.resize(1)
+    assert parse_cache.cache_info().currsize == 1
+    with pytest.raises(ValueError):
+        parse_cache.resize(-1)
+
+
+def test_parse_cache_clear(parse_cache):
+    uri_reference("http://a")
+    parse_cache.cache_clear()
+    assert parse_cache.cache_info() == cache.CacheInfo(0, 0, 0, 2, 0)
+
+
+def test_parse_cache_ignores_unhashable_input(parse_cache):
+    reference = uri_reference(bytearray(b"http://a"))
+    assert reference.authority == "a"
+    assert parse_cache.cache_info().currsize == 0
+
+
+def test_parse_cache_is_thread_safe():
+    parse_cache = cache.ParseCache(maxsize=8)
+
+    def hammer(offset):
+        for i in range(2000):
+            key = (i + offset) % 16
+            if parse_cache.get(key) is None:
+                parse_cache.put(key, key)
+
+    threads = [threading.Thread(target=hammer, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    info = parse_cache.cache_info()
+    assert info.hits + info.misses == 8 * 2000
+    assert info.currsize == 8
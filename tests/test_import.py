@@ -0,0 +1,141 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import rfc3986
+
+try:
+    import idna
+except ImportError:
+    idna = None
+
+requires_idna = pytest.mark.skipif(
+    idna is None, reason="This test requires the 'idna' module"
+)
+
+HEAVY_MODULES = {"idna", "urllib.parse"}
+
+
+def run_python(*args):
+    package_root = os.path.dirname(os.path.dirname(rfc3986.__file__))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        filter(None, [package_root, env.get("PYTHONPATH")])
+    )
+    return subprocess.run(
+        [sys.executable, *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def modules_imported_by_import():
+    """Return the modules ``import rfc3986`` imports, per ``-X importtime``."""
+    result = run_python("-X", "importtime", "-c", "import rfc3986")
+    return {
+        line.rpartition("|")[2].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:") and "|" in line
+    }
+
+
+def modules_loaded_after(code):
+    """Run ``code`` in a new interpreter and return ``sys.modules``."""
+    result = run_python(
+        "-c", code + "\nimport sys\nprint('\\n'.join(sys.modules))\n"
+    )
+    return set(result.stdout.split())
+
+
+def test_importing_rfc3986_imports_no_submodules():
+    modules = modules_imported_by_import()
+    assert "rfc3986" in modules
+    assert {m for m in modules if m.startswith("rfc3986.")} == set()
+    assert not modules & HEAVY_MODULES
+
+
+def test_parsing_uris_does_not_import_idna_or_urllib():
+    modules = modules_loaded_after(
+        "import rfc3986\n"
+        "rfc3986.uri_reference('HTTP://Example.COM/a/../b').normalize()\n"
+        "rfc3986.urlparse('https://user@example.com:443/')\n"
+        "rfc3986.iri_reference('http://example.com/\\u00fc').encode()\n"
+    )
+    assert "rfc3986.api" in modules
+    assert not modules & HEAVY_MODULES
+
+
+@requires_idna
+def test_idna_is_imported_for_hosts_that_need_it():
+    modules = modules_loaded_after(
+        "import rfc3986\n"
+        "rfc3986.iri_reference('http://\\u00fc.example/').encode()\n"
+    )
+    assert "idna" in modules
+
+
+@pytest.mark.parametrize(
+    "module",
+    sorted(
+        name[:-3]
+        for name in os.listdir(os.path.dirname(rfc3986.__file__))
+        if name.endswith(".py") and name not in {"__init__.py", "__main__.py"}
+    ),
+)
+def test_each_submodule_can_be_imported_first(module):
+    # The package no longer imports api before anything else, so a
+    # submodule imported on its own must not hit an import cycle.
+    assert f"rfc3986.{module}" in modules_loaded_after(
+        f"import rfc3986.{module}"
+    )
+
+
+def test_lazy_names():
+    from rfc3986 import api
+
+    assert rfc3986.uri_reference is api.uri_reference
+    assert set(rfc3986.__all__) <= set(dir(rfc3986))
+    for name in rfc3986.__all__:
+        assert getattr(rfc3986, name) is not None
+
+
+def test_submodules_are_attributes_after_a_plain_import():
+    # Importing rfc3986 used to import these, so code could use them as
+    # attributes of the package without importing them itself.
+    submodules = sorted(rfc3986._SUBMODULES)
+    result = run_python(
+        "-c",
+        "import types, rfc3986\n"
+        f"for name in {submodules!r}:\n"
+        "    module = getattr(rfc3986, name)\n"
+        "    assert isinstance(module, types.ModuleType), name\n"
+        "    assert module.__name__ == 'rfc3986.' + name, name\n"
+        "rfc3986.exceptions.InvalidAuthority\n"
+        "rfc3986.validators.Validator()\n"
+        "print('ok')\n",
+    )
+    assert result.stdout == "ok\n"
+    assert set(submodules) <= set(dir(rfc3986))
+
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError, match="no_such_name"):
+        rfc3986.no_such_name
+
+
+def test_misc_matchers_are_compiled_on_first_use():
+    modules = modules_loaded_after(
+        "import rfc3986.api, rfc3986.misc\n"
+        "rfc3986.api.uri_reference('https://example.com/a')\n"
+        "compiled = [name for name in vars(rfc3986.misc)"
+        " if name.endswith('_MATCHER')]\n"
+        "assert compiled == [], compiled\n"
+        "rfc3986.api.uri_reference('https://example.com/a').host\n"
+        "assert 'SUBAUTHORITY_MATCHER' in vars(rfc3986.misc)\n"
+        "assert 'ISUBAUTHORITY_MATCHER' not in vars(rfc3986.misc)\n"
+    )
+    assert "rfc3986.misc" in modules
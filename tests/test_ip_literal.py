@@ -0,0 +1,208 @@
+import random
+import re
+
+import pytest
+
+from rfc3986 import _ip_literal
+from rfc3986 import abnf_regexp
+from rfc3986 import exceptions
+from rfc3986 import misc
+from rfc3986 import parseresult
+from rfc3986 import validators
+
+from . import conftest
+
+IP_LITERAL_MATCHER = re.compile("^" + abnf_regexp.IP_LITERAL_RE + "$")
+
+tricky_hosts = [
+    "[]",
+    "[::]",
+    "[:::]",
+    "[::1]",
+    "[1::]",
+    "[1:::]",
+    "[:1::]",
+    "[1::2::3]",
+    "[1:2:3:4:5:6:7:8]",
+    "[1:2:3:4:5:6:7:8:9]",
+    "[1:2:3:4:5:6:7]",
+    "[1:2:3:4:5:6:7::]",
+    "[::2:3:4:5:6:7:8]",
+    "[1:2:3:4:5:6:7::8]",
+    "[12345::]",
+    "[::ffff]",
+    "[::fffff]",
+    "[::g]",
+    "[::x]",
+    "[x::1]",
+    "[0x1::]",
+    "[::1.2.3.4]",
+    "[::ffff:1.2.3.4]",
+    "[::999.999.999.999]",
+    "[::1.2.3]",
+    "[::1.2.3.4.5]",
+    "[::1.2.3.1234]",
+    "[1.2.3.4::]",
+    "[1.2.3.4]",
+    "[1:2:3:4:5:6:1.2.3.4]",
+    "[1:2:3:4:5:1.2.3.4]",
+    "[1:2:3:4:5:6:7:1.2.3.4]",
+    "[1:2:3:4:5::1.2.3.4]",
+    "[1:2:3:4:5:6::1.2.3.4]",
+    "[::1%eth0]",
+    "[::1%25eth0]",
+    "[::1%25]",
+    "[::1%2]",
+    "[::1%]",
+    "[::1%%]",
+    "[::1%2525]",
+    "[::1%25%41]",
+    "[::1%25%4]",
+    "[::1%25%4g]",
+    "[::1%25eth!0]",
+    "[::1%25eth0%]",
+    "[fe80::1%25en0]",
+    "[FE80::1%25EN0]",
+    "[v1.x]",
+    "[V1.x]",
+    "[v.x]",
+    "[v1.]",
+    "[v1x.y]",
+    "[vF.a:b!$]",
+    "[v1.a%20]",
+    "[::1]\n",
+    "[::1]\n\n",
+    "\n[::1]",
+    "[١::]",
+    "[::１]",
+]
+
+tricky_authorities = tricky_hosts + [
+    "[::1]:80",
+    "[::1]:",
+    "[::1]:123456",
+    "[::1]:80\n",
+    "[::1]:٨٠",
+    "[::1]80",
+    "[::1][::2]",
+    "user@[::1]",
+    "user:pass@[::1]:443",
+    "@[::1]",
+    "us%20er@[::1]",
+    "us%2er@[::1]",
+    "us]er@[::1]",
+    "u@v@[::1]",
+    "[::1]@host",
+    "host[::1]",
+    "host:[::1]",
+    "[::1",
+]
+
+
+def _random_hosts(count, seed=6874):
+    rng = random.Random(seed)
+    pieces = [
+        "0",
+        "1",
+        "ab",
+        "FFFF",
+        "12345",
+        "g",
+        "x",
+        ":",
+        "::",
+        ".",
+        "1.2.3.4",
+        "999.0.0.1",
+        "%",
+        "%25",
+        "%4",
+        "en0",
+        "v1.",
+        "~",
+        "!",
+    ]
+    for _ in range(count):
+        length = rng.randint(0, 12)
+        yield "[%s]" % "".join(rng.choice(pieces) for _ in range(length))
+
+
+def _random_authorities(count, seed=4007):
+    rng = random.Random(seed)
+    for host in _random_hosts(count, seed):
+        userinfo = rng.choice(["", "user@", "u:p@", "@", "%zz@"])
+        port = rng.choice(["", ":80", ":", ":123456", "\n"])
+        yield userinfo + host + port
+
+
+def _regex_split(authority):
+    match = misc.SUBAUTHORITY_MATCHER.match(authority)
+    return match and match.group("userinfo", "host", "port")
+
+
+@pytest.mark.parametrize("host", tricky_hosts)
+def test_is_ipv6_literal_matches_regex(host):
+    assert _ip_literal.is_ipv6_literal(host) == bool(
+        misc.IPv6_MATCHER.match(host)
+    )
+    assert _ip_literal.is_ipv6_literal(host, rfc4007=False) == bool(
+        misc.IPv6_NO_RFC4007_MATCHER.match(host)
+    )
+
+
+@pytest.mark.parametrize("host", tricky_hosts)
+def test_is_ip_literal_matches_regex(host):
+    assert _ip_literal.is_ip_literal(host) == bool(
+        IP_LITERAL_MATCHER.match(host)
+    )
+
+
+@pytest.mark.parametrize("authority", tricky_authorities)
+def test_split_authority_matches_regex(authority):
+    assert _ip_literal.split_authority(authority) == _regex_split(authority)
+
+
+def test_literals_match_regex_on_random_input():
+    for host in _random_hosts(5000):
+        assert _ip_literal.is_ipv6_literal(host) == bool(
+            misc.IPv6_MATCHER.match(host)
+        ), host
+        assert _ip_literal.is_ipv6_literal(host, rfc4007=False) == bool(
+            misc.IPv6_NO_RFC4007_MATCHER.match(host)
+        ), host
+        assert _ip_literal.is_ip_literal(host) == bool(
+            IP_LITERAL_MATCHER.match(host)
+        ), host
+
+
+def test_split_authority_matches_regex_on_random_input():
+    for authority in _random_authorities(5000):
+        assert _ip_literal.split_authority(authority) == _regex_split(
+            authority
+        ), authority
+
+
+@pytest.mark.parametrize(
+    "host", conftest.valid_hosts + conftest.invalid_hosts + tricky_hosts
+)
+def test_host_is_valid_matches_regex(host):
+    expected = bool(misc.HOST_MATCHER.match(host))
+    if expected and misc.IPv4_MATCHER.match(host):
+        expected = validators.valid_ipv4_host_address(host)
+    elif expected and misc.IPv6_MATCHER.match(host):
+        expected = bool(misc.IPv6_NO_RFC4007_MATCHER.match(host))
+    assert validators.host_is_valid(host) is expected
+
+
+@pytest.mark.parametrize("authority", tricky_authorities)
+def test_bytes_match_text(authority):
+    uri = "http://%s/path" % authority.rstrip("\n")
+    try:
+        expected = parseresult.ParseResult.from_string(uri, strict=True)
+    except exceptions.RFC3986Exception as error:
+        with pytest.raises(type(error)):
+            parseresult.ParseResultBytes.from_string(uri.encode("utf-8"))
+    else:
+        parsed = parseresult.ParseResultBytes.from_string(uri.encode("utf-8"))
+        assert parsed.host == expected.host.encode("utf-8")
+        assert parsed.port == expected.port
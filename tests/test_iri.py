@@ -1,7 +1,11 @@
+import pickle
+
 import pytest
 
 import rfc3986
 from rfc3986.exceptions import InvalidAuthority
+from rfc3986.iri import IDNA_CACHE_SIZE
+from rfc3986.iri import _idna_encode_host
 
 try:
     import idna
@@ -72,3 +76,63 @@ def test_encode_invalid_iri(iri):
     iri_ref = rfc3986.iri_reference(iri)
     with pytest.raises(InvalidAuthority):
         iri_ref.encode()
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+def test_iri_pickles_with_its_encoding(encoding):
+    iri = rfc3986.iri_reference("http://résumé.example/", encoding)
+    iri.host
+    copy = pickle.loads(pickle.dumps(iri))
+    assert copy == iri
+    assert copy.encoding == encoding
+    assert "_cached_authority_info" not in vars(copy)
+
+
+@pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+def test_iri_replace_keeps_the_encoding(encoding):
+    iri = rfc3986.iri_reference("http://résumé.example/", encoding)
+    assert iri._replace(path="/other").encoding == encoding
+    assert iri.copy_with(path="/other").encoding == encoding
+
+
+@requires_idna
+def test_encode_remembers_hosts(monkeypatch):
+    iri_ref = rfc3986.iri_reference("http://Bẞ.example.com/")
+    assert iri_ref.encode().authority == "xn--b-qfa.example.com"
+
+    monkeypatch.setattr(
+        idna, "encode", lambda *args, **kwargs: pytest.fail("encoded again")
+    )
+    assert iri_ref.encode().authority == "xn--b-qfa.example.com"
+    cache_info = _idna_encode_host.cache_info()
+    assert cache_info.maxsize == IDNA_CACHE_SIZE
+
+
+def test_encode_ascii_host_is_not_split(monkeypatch):
+    iri_ref = rfc3986.iri_reference("http://user@Example.COM:80/")
+    monkeypatch.setattr(
+        "rfc3986.iri._idna_encode_host",
+        lambda host: pytest.fail("host was split"),
+    )
+    assert iri_ref.encode().authority == "user@Example.COM:80"
+
+
+@requires_idna
+def test_encode_invalid_host_is_not_remembered():
+    iri_ref = rfc3986.iri_reference("http://♥.net")
+    for _ in range(2):
+        with pytest.raises(InvalidAuthority):
+            iri_ref.encode()
+
+
+def test_encode_with_custom_encoder_is_not_cached():
+    calls = []
+
+    def encoder(label):
+        calls.append(label)
+        return label.upper()
+
+    iri_ref = rfc3986.iri_reference("http://ẞ.example.com")
+    assert iri_ref.encode(encoder).authority == "ẞ.EXAMPLE.COM"
+    assert iri_ref.encode(encoder).authority == "ẞ.EXAMPLE.COM"
+    assert calls == ["ẞ", "example", "com"] * 2
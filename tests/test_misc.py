@@ -1,3 +1,10 @@
+import random
+import re
+
+import pytest
+
+from rfc3986 import abnf_regexp
+from rfc3986 import misc
 from rfc3986.misc import merge_paths
 from rfc3986.uri import URIReference
 
@@ -48,3 +55,49 @@ def test_merge_paths_with_base_authority_without_path():
     )
     expected = "/relative"
     assert merge_paths(base, "relative") == expected
+
+
+_ABSOLUTE_PIECE_PATTERNS = [
+    (misc._ABSOLUTE_PATH_ABEMPTY_MATCHER, abnf_regexp.PATH_ABEMPTY),
+    (
+        misc._ABSOLUTE_PATH_MATCHER,
+        "(?:%s|%s|%s)"
+        % (
+            abnf_regexp.PATH_ABSOLUTE,
+            abnf_regexp.PATH_ROOTLESS,
+            abnf_regexp.PATH_EMPTY,
+        ),
+    ),
+    (misc._ABSOLUTE_QUERY_MATCHER, abnf_regexp.QUERY_RE[1:-1]),
+]
+
+
+@pytest.mark.parametrize("matcher, pattern", _ABSOLUTE_PIECE_PATTERNS)
+def test_absolute_piece_matchers_match_abnf_patterns(matcher, pattern):
+    """Show the rewritten patterns accept the same strings as the ABNF."""
+    expected = re.compile(pattern)
+    alphabet = list("/?:@aZ9._~!$&'()*+,;=%#[] \\\n") + ["%2f", "%zz"]
+    rng = random.Random(3986)
+    for _ in range(20000):
+        string = "".join(
+            rng.choice(alphabet) for _ in range(rng.randint(0, 8))
+        )
+        assert bool(matcher.fullmatch(string)) is bool(
+            expected.fullmatch(string)
+        ), string
+
+
+def test_matchers_are_compiled_once():
+    assert misc.PATH_MATCHER is misc.PATH_MATCHER
+    assert misc.FRAGMENT_MATCHER is misc.QUERY_MATCHER
+    assert isinstance(misc.ISUBAUTHORITY_MATCHER, re.Pattern)
+
+
+def test_matchers_are_listed():
+    assert "IPv6_MATCHER" in dir(misc)
+    assert "FRAGMENT_MATCHER" in dir(misc)
+
+
+def test_unknown_names_raise_attribute_error():
+    with pytest.raises(AttributeError, match="NO_SUCH_MATCHER"):
+        misc.NO_SUCH_MATCHER
@@ -27,6 +27,23 @@ def test_normalize_percent_characters():
     )
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("", ""),
+        ("no-escapes-here", "no-escapes-here"),
+        ("100%", "100%"),
+        ("%%7e%", "%%7E%"),
+        ("%zz%e9", "%zz%E9"),
+        ("%5b" * 1000, "%5B" * 1000),
+        ("%aB/%Ab/%ab/%AB", "%AB/%AB/%AB/%AB"),
+        ("%3a%3A%4d", "%3A%3A%4D"),
+    ],
+)
+def test_normalize_percent_characters_edge_cases(value, expected):
+    assert normalize_percent_characters(value) == expected
+
+
 paths = [
     # (Input, expected output)
     ("/foo/bar/.", "/foo/bar/"),
@@ -107,6 +124,30 @@ def test_detect_percent_encoded_component(component, encoded_component):
     assert encode_component(component, "utf-8") == encoded_component
 
 
+@pytest.mark.parametrize(
+    ["component", "encoding", "encoded_component"],
+    [
+        ("", "utf-8", ""),
+        ("/path/to/resource", "utf-8", "/path/to/resource"),
+        ("a=b&c=d", "utf-8", "a=b&c=d"),
+        (b"/path", "utf-8", "/path"),
+        ("/a b", "utf-8", "/a%20b"),
+        ("/%20a b", "utf-8", "/%20a%20b"),
+        ("/%a b", "utf-8", "/%25a%20b"),
+        ("/\u00e9", "utf-8", "/%C3%A9"),
+        ("/\u00e9", "latin-1", "/%E9"),
+        (b"/\xc3\xa9", "utf-8", "/%C3%A9"),
+    ],
+)
+def test_encode_component(component, encoding, encoded_component):
+    assert encode_component(component, encoding) == encoded_component
+
+
+def test_encode_component_returns_clean_component_unchanged():
+    component = "/already/clean%20path"
+    assert encode_component(component, "utf-8") is component
+
+
 @pytest.mark.parametrize(
     ["host", "normalized_host"],
     [
@@ -0,0 +1,116 @@
+import random
+
+import pytest
+
+from rfc3986 import _scanner
+from rfc3986.misc import URI_MATCHER
+from rfc3986.normalizers import encode_component
+from rfc3986.uri import URIReference
+
+from . import conftest
+
+COMPONENTS = ("scheme", "authority", "path", "query", "fragment")
+
+tricky_references = [
+    "",
+    ":",
+    "//",
+    "///",
+    "?",
+    "#",
+    "?#",
+    "#?",
+    ":/",
+    "a:",
+    "a:/",
+    "a://",
+    ":foo",
+    "1a:foo",
+    "a1+-.:foo",
+    "a_b:foo",
+    "é:foo",
+    "foo/bar:baz",
+    "foo?bar:baz",
+    "foo#bar:baz",
+    "[::1]",
+    "[::1]:80",
+    "http:",
+    "http:foo",
+    "http:/foo",
+    "http:///foo",
+    "http:////foo",
+    "http://\\foo",
+    "http://host\\path",
+    "http://host?query",
+    "http://host#fragment",
+    "http://host?query#fragment",
+    "http://host?query?more#fragment#more",
+    "http://u@h:1/p?q#f",
+    "http://[::1]:443/p",
+    "//host",
+    "//host/path",
+    "//:80",
+    "\\\\host\\path",
+    "mailto:user@example.com",
+    "urn:isbn:0451450523",
+    "a\nb://c\nd/e\nf?g\nh#i\nj",
+    "http://h/\u00e9?\u00e9#\u00e9",
+]
+
+
+def _regex_split(uri_string):
+    groups = URI_MATCHER.match(uri_string).groupdict()
+    return tuple(groups[c] for c in COMPONENTS)
+
+
+def _random_references(count, seed=3986):
+    rng = random.Random(seed)
+    alphabet = "aZ09+-.:/?#[]@\\%\n é"
+    for _ in range(count):
+        length = rng.randint(0, 16)
+        yield "".join(rng.choice(alphabet) for _ in range(length))
+
+
+@pytest.mark.parametrize("uri_string", tricky_references)
+def test_split_matches_regex(uri_string):
+    assert _scanner.split(uri_string) == _regex_split(uri_string)
+
+
+def test_split_matches_regex_on_random_input():
+    for uri_string in _random_references(5000):
+        assert _scanner.split(uri_string) == _regex_split(uri_string), (
+            uri_string
+        )
+
+
+@pytest.mark.parametrize(
+    "uri_string",
+    [
+        "https://%s/path?query#fragment" % host
+        for host in conftest.valid_hosts + conftest.invalid_hosts
+    ],
+)
+def test_split_matches_regex_on_fixture_hosts(uri_string):
+    assert _scanner.split(uri_string) == _regex_split(uri_string)
+
+
+def test_from_string_matches_regex_path():
+    for uri_string in tricky_references + list(_random_references(500)):
+        groups = _regex_split(uri_string)
+        expected = URIReference(
+            groups[0],
+            groups[1],
+            *(encode_component(g, "utf-8") for g in groups[2:]),
+        )
+        assert tuple(URIReference.from_string(uri_string)) == tuple(expected)
+
+
+def test_split_bytes_matches_split():
+    for uri_string in tricky_references + list(_random_references(5000)):
+        if not uri_string.isascii():
+            continue
+        expected = tuple(
+            c if c is None else c.encode("ascii")
+            for c in _scanner.split(uri_string)
+        )
+        assert _scanner.split_bytes(uri_string.encode("ascii")) == expected
@@ -0,0 +1,123 @@
+import io
+import mmap
+
+import pytest
+
+from rfc3986 import stream
+from rfc3986.api import normalize_uri
+
+lines = [
+    "HTTP://EXAMPLE.COM",
+    "https://Example.org/a/./b/../c?Q=%2f#%7e",
+    "/relative/%7epath",
+    "",
+    "mailto:User@Example.COM",
+    "ssh://user@[::1]:22",
+]
+expected = [normalize_uri(line) for line in lines]
+
+
+@pytest.fixture
+def url_file(tmp_path):
+    path = tmp_path / "urls.txt"
+    path.write_bytes("\n".join(lines).encode() + b"\n")
+    return path
+
+
+def test_normalize_lines_from_path(url_file):
+    assert list(stream.normalize_lines(url_file)) == expected
+    assert list(stream.normalize_lines(str(url_file))) == expected
+
+
+@pytest.mark.parametrize("trailer", [b"", b"\n", b"\r\n"])
+def test_line_endings(tmp_path, trailer):
+    path = tmp_path / "urls.txt"
+    path.write_bytes("\r\n".join(lines).encode() + trailer)
+    assert list(stream.normalize_lines(path)) == expected
+
+
+def test_normalize_lines_from_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    reports = []
+    result = stream.normalize_lines(
+        path, progress=lambda *args: reports.append(args)
+    )
+    assert list(result) == []
+    assert reports == [(0, 0)]
+
+
+def test_normalize_lines_without_mmap(monkeypatch, url_file):
+    def unmappable(*args, **kwargs):
+        raise OSError("cannot map")
+
+    monkeypatch.setattr(mmap, "mmap", unmappable)
+    assert list(stream.normalize_lines(url_file)) == expected
+
+
+@pytest.mark.parametrize(
+    "file",
+    [
+        io.BytesIO("\n".join(lines).encode()),
+        io.StringIO("\n".join(lines) + "\n"),
+    ],
+)
+def test_normalize_lines_from_file_objects(file):
+    assert list(stream.normalize_lines(file)) == expected
+    assert not file.closed
+
+
+def test_progress_is_reported(monkeypatch, url_file):
+    monkeypatch.setattr(stream, "PROGRESS_INTERVAL", 40)
+    size = url_file.stat().st_size
+    reports = []
+
+    def progress(position, total):
+        reports.append((position, total))
+
+    assert list(stream.normalize_lines(url_file, progress=progress)) == (
+        expected
+    )
+    assert len(reports) > 2
+    assert reports == sorted(reports)
+    assert reports[-1] == (size, size)
+    assert all(total == size for _, total in reports)
+
+
+def test_progress_of_file_objects_has_no_total():
+    reports = []
+    list(
+        stream.normalize_lines(
+            io.BytesIO(b"http://a\n"), progress=lambda *a: reports.append(a)
+        )
+    )
+    assert reports == [(9, None)]
+
+
+invalid_file = b"http://example.com\nhttp://example.com/\xff\nHTTP://A\n"
+
+
+def test_errors_are_raised_by_default(tmp_path):
+    path = tmp_path / "urls.txt"
+    path.write_bytes(invalid_file)
+    normalized = stream.normalize_lines(path)
+    assert next(normalized) == "http://example.com"
+    with pytest.raises(UnicodeDecodeError):
+        next(normalized)
+
+
+def test_errors_can_be_skipped_or_yielded():
+    skipped = stream.normalize_lines(io.BytesIO(invalid_file), on_error="skip")
+    assert list(skipped) == ["http://example.com", "http://a"]
+
+    yielded = list(
+        stream.normalize_lines(io.BytesIO(invalid_file), on_error="yield")
+    )
+    assert yielded[0] == "http://example.com"
+    assert isinstance(yielded[1], UnicodeDecodeError)
+    assert yielded[2] == "http://a"
+
+
+def test_invalid_error_policy_is_rejected_eagerly():
+    with pytest.raises(ValueError):
+        stream.normalize_lines(io.BytesIO(), on_error="ignore")
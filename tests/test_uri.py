@@ -1,9 +1,19 @@
+import pickle
+import random
+import re
+
 import pytest
 
+import rfc3986
 from rfc3986.exceptions import InvalidAuthority
 from rfc3986.exceptions import ResolutionError
+from rfc3986.iri import IRIReference
+from rfc3986.misc import ABSOLUTE_URI_MATCHER
 from rfc3986.misc import URI_MATCHER
+from rfc3986.uri import CanonicalURI
+from rfc3986.uri import Resolver
 from rfc3986.uri import URIReference
+from rfc3986.view import URIView
 
 from . import base
 
@@ -285,6 +295,99 @@ class TestURIReferenceIsAbsolute:
         assert uri.is_absolute() is True
 
 
+def pattern_is_absolute(uri):
+    """The implementation of is_absolute before components were checked."""
+    return bool(ABSOLUTE_URI_MATCHER.match(uri.unsplit()))
+
+
+_ABSOLUTE_PIECES = {
+    "scheme": [None, "http", "a+b.c-d", "1http", "ht\ntp", "a:b"],
+    "authority": [
+        None,
+        "",
+        "example.com",
+        "user:pass@[::1]:80",
+        "a/b",
+        "a?b",
+        "a\\b",
+        "a\n",
+    ],
+    "path": [
+        None,
+        "",
+        "/",
+        "//a",
+        "/a/b",
+        "a",
+        "a:b/c",
+        "x/y:z",
+        "/a%20b",
+        "/a%2",
+        "/a b",
+        "/a?b",
+        "/a\n",
+        "?x",
+    ],
+    "query": [None, "", "a=b", "a=b?c:d/e", "a b", "%zz", "a\n", "#"],
+    "fragment": [None, "", "top"],
+}
+
+
+class TestURIReferenceIsAbsoluteMatchesPattern:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_constructed_references(self, seed):
+        rng = random.Random(seed)
+        for _ in range(200):
+            components = {
+                name: rng.choice(pieces)
+                for name, pieces in _ABSOLUTE_PIECES.items()
+            }
+            uri = URIReference(**components)
+            assert uri.is_absolute() is pattern_is_absolute(uri), components
+
+    @pytest.mark.parametrize(
+        "uri_string",
+        [
+            "http://example.com",
+            "http://example.com/a?b",
+            "http://example.com/a?b#c",
+            "http:",
+            "http:?q",
+            "http:a/b",
+            "http:/a/b",
+            "http:////a",
+            "http://a\\b/c",
+            "http://a/b c",
+            "http://a/b\n",
+            "http://a/b?c\n",
+            "mailto:user@example.com",
+            "urn:isbn:0451450523",
+            "//example.com/a",
+            "/a/b",
+            "a/b",
+            "./a:b",
+            "",
+            "?q",
+            "#f",
+        ],
+    )
+    def test_parsed_references(self, uri_string):
+        for uri in (
+            URIReference.from_string(uri_string),
+            IRIReference.from_string(uri_string),
+            URIView.from_string(uri_string),
+        ):
+            assert uri.is_absolute() is pattern_is_absolute(uri)
+
+    def test_relative_references_do_not_use_the_pattern(self, monkeypatch):
+        monkeypatch.setattr(
+            "rfc3986.misc.ABSOLUTE_URI_MATCHER", re.compile("(?!)")
+        )
+        assert URIReference.from_string("../a/b").is_absolute() is False
+        assert URIReference.from_string("http://a/b?c").is_absolute() is True
+        assert URIReference.from_string("http://a/b#c").is_absolute() is False
+
+
 # @pytest.fixture(params=[
 #     basic_uri, basic_uri_with_port, basic_uri_with_path,
 #     scheme_and_path_uri, uri_with_path_and_query
@@ -386,6 +489,71 @@ class TestURIReferencesResolve:
         assert T1 == T2
         assert T1 == B
 
+    @pytest.mark.parametrize(
+        "reference",
+        [
+            "g:h",
+            "g",
+            "./g",
+            "g/",
+            "/g",
+            "//g",
+            "?y",
+            "g?y",
+            "#s",
+            "g#s",
+            "",
+            ".",
+            "../",
+            "../../../g",
+            "/./g",
+            "g;x=1/../y",
+            "http:g",
+        ],
+    )
+    @pytest.mark.parametrize("strict", [True, False])
+    def test_resolver_matches_resolve_with(self, reference, strict):
+        B = URIReference.from_string("http://a/b/c/d;p?q")
+        R = URIReference.from_string(reference)
+        resolver = B.resolver()
+        assert resolver.resolve(R, strict) == R.resolve_with(B, strict)
+        assert resolver.resolve(reference, strict) == R.resolve_with(
+            B, strict
+        )
+
+    def test_resolver_with_pathless_base(self):
+        resolver = URIReference.from_string("http://example.com").resolver()
+        assert resolver.resolve("g").path == "/g"
+
+    def test_resolver_with_authorityless_base(self):
+        B = URIReference.from_string("urn:a:b")
+        R = URIReference.from_string("g")
+        assert B.resolver().resolve(R) == R.resolve_with(B)
+
+    def test_resolver_resolve_many(self, basic_uri):
+        B = URIReference.from_string(basic_uri)
+        references = ["g", "../g", "?q"]
+        resolved = B.resolver().resolve_many(references)
+        assert list(resolved) == [
+            URIReference.from_string(r).resolve_with(B) for r in references
+        ]
+
+    def test_resolver_normalizes_base_once(self, basic_uri):
+        B = URIReference.from_string(basic_uri.upper())
+        resolver = B.resolver()
+        assert resolver.base_uri is B.normalize()
+
+    def test_resolver_rejects_schemeless_base(self, relative_uri):
+        B = URIReference.from_string(relative_uri)
+        with pytest.raises(ResolutionError):
+            B.resolver()
+
+    def test_resolver_defaults_to_requiring_a_scheme(self, relative_uri):
+        B = URIReference.from_string("http://a/b/c/d;p?q")
+        assert Resolver(B).resolve("../g") == B.resolver().resolve("../g")
+        with pytest.raises(ResolutionError):
+            Resolver(URIReference.from_string(relative_uri))
+
 
 def test_empty_querystrings_persist():
     url = "https://httpbin.org/get?"
@@ -404,3 +572,261 @@ def test_wide_domain_bypass_check():
     ref = URIReference.from_string(url)
     assert ref.scheme == "https"
     assert ref.host == "xdavidhu.me"
+
+
+class TestURIReferenceCachesAuthorityInfo:
+    def test_subauthority_is_matched_once(
+        self, monkeypatch, uri_with_everything
+    ):
+        uri = URIReference.from_string(uri_with_everything)
+        calls = []
+        split_authority = URIReference._split_authority
+
+        def counting_split(self, authority):
+            calls.append(self)
+            return split_authority(self, authority)
+
+        monkeypatch.setattr(URIReference, "_split_authority", counting_split)
+        assert uri.host is not None
+        assert uri.port == "443"
+        assert uri.userinfo == "user:pass"
+        uri.authority_info()
+        assert len(calls) == 1
+
+    def test_invalid_authority_is_remembered(self, monkeypatch, invalid_uri):
+        uri = URIReference.from_string(invalid_uri)
+        with pytest.raises(InvalidAuthority):
+            uri.authority_info()
+
+        monkeypatch.setattr(
+            URIReference,
+            "_split_authority",
+            lambda self, authority: pytest.fail("authority was parsed again"),
+        )
+        with pytest.raises(InvalidAuthority):
+            uri.authority_info()
+        assert uri.host is None
+
+    def test_authority_info_returns_a_copy(self, basic_uri):
+        uri = URIReference.from_string(basic_uri)
+        uri.authority_info()["host"] = "evil.example"
+        assert uri.host == basic_uri[7:]
+
+    def test_cache_does_not_change_hash_or_equality(self, basic_uri):
+        uri = URIReference.from_string(basic_uri)
+        before = hash(uri)
+        uri.host
+        assert hash(uri) == before == hash(tuple(uri))
+        assert uri == URIReference.from_string(basic_uri)
+
+    def test_copy_with_does_not_keep_authority_info(self, basic_uri):
+        uri = URIReference.from_string(basic_uri)
+        uri.host
+        copy = uri.copy_with(authority="example.org:8080")
+        assert copy.host == "example.org"
+        assert copy.port == "8080"
+
+
+def test_from_strings_matches_from_string(uri_with_everything, relative_uri):
+    uris = [uri_with_everything, relative_uri, "/%a b", b"mailto:a@b.c"]
+    references = list(URIReference.from_strings(uris, "utf-8"))
+    assert [tuple(r) for r in references] == [
+        tuple(URIReference.from_string(uri)) for uri in uris
+    ]
+    assert all(type(r) is URIReference for r in references)
+
+
+def test_from_strings_yields_type_errors():
+    (error,) = URIReference.from_strings([1], on_error="yield")
+    assert isinstance(error, TypeError)
+
+
+class TestURIReferenceMemoisesNormalize:
+    def test_normalize_is_remembered(self, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything.upper())
+        assert uri.normalize() is uri.normalize()
+
+    def test_normalized_reference_is_its_own_normal_form(
+        self, uri_with_everything
+    ):
+        normalized = URIReference.from_string(uri_with_everything).normalize()
+        assert normalized.normalize() is normalized
+
+    def test_copy_of_normalized_reference_is_normalized_again(self):
+        normalized = URIReference.from_string("http://a/b").normalize()
+        copy = normalized.copy_with(scheme="HTTP")
+        assert copy.normalize() is not copy
+        assert copy.normalize().scheme == "http"
+
+    def test_normalized_references_compare_without_normalizing(
+        self, monkeypatch
+    ):
+        first = URIReference.from_string("HTTP://A/%7e").normalize()
+        second = URIReference.from_string("http://b/").normalize()
+        third = URIReference.from_string("http://A/%7E").normalize()
+
+        monkeypatch.setattr(
+            "rfc3986.normalizers.normalize_path",
+            lambda path: pytest.fail("reference was normalized again"),
+        )
+        assert first != second
+        assert first == third
+
+
+class TestURIReferenceLayout:
+    def test_default_encoding_is_not_stored(self, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything)
+        assert uri.encoding == "utf-8"
+        assert "encoding" not in vars(uri)
+
+    def test_other_encodings_are_stored(self):
+        uri = URIReference.from_string(b"http://a/\xe9", "latin-1")
+        assert uri.encoding == "latin-1"
+        assert uri.copy_with(path="/b").encoding == "latin-1"
+        assert uri.normalize().encoding == "latin-1"
+
+    @pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+    def test_replace_keeps_the_encoding(self, encoding, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything, encoding)
+        assert uri._replace(path="/other").encoding == encoding
+
+    @pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+    @pytest.mark.parametrize("encoding", ["utf-8", "latin-1"])
+    def test_pickles_without_caches(
+        self, protocol, encoding, uri_with_everything
+    ):
+        uri = URIReference.from_string(uri_with_everything, encoding)
+        uri.host
+        uri.normalize()
+        copy = pickle.loads(pickle.dumps(uri, protocol))
+        assert type(copy) is URIReference
+        assert tuple(copy) == tuple(uri)
+        assert copy.encoding == encoding
+        assert "_cached_authority_info" not in vars(copy)
+        assert "_normalized" not in vars(copy)
+
+
+class TestURIReferenceCanonicalKey:
+    def test_key_is_normalized_components(self, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything.upper())
+        assert uri.canonical_key() == tuple(uri.normalize())
+        assert type(uri.canonical_key()) is tuple
+
+    def test_key_is_remembered(self, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything)
+        assert uri.canonical_key() is uri.canonical_key()
+
+    def test_key_is_not_pickled(self, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything)
+        uri.canonical_key()
+        copy = pickle.loads(pickle.dumps(uri))
+        assert "_canonical_key" not in vars(copy)
+
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            ("HTTP://Example.com/%7euser", "http://example.com/%7Euser"),
+            ("http://a/b/../c", "http://a/c"),
+            ("http://a/b", "http://a/b"),
+        ],
+    )
+    def test_equal_references_have_equal_keys(self, first, second):
+        first_ref = URIReference.from_string(first)
+        second_ref = URIReference.from_string(second)
+        assert first_ref == second_ref
+        assert first_ref.canonical_key() == second_ref.canonical_key()
+
+
+class TestCanonicalURI:
+    def test_equal_references_hash_equally(self):
+        first = CanonicalURI.from_string("HTTP://Example.com/%7euser")
+        second = CanonicalURI.from_string("http://example.com/%7Euser")
+        assert first == second
+        assert not first != second
+        assert hash(first) == hash(second)
+        assert len({first, second}) == 1
+
+    def test_different_references(self, basic_uri, basic_uri_with_port):
+        first = CanonicalURI.from_string(basic_uri)
+        second = CanonicalURI.from_string(basic_uri_with_port)
+        assert first != second
+        assert not first == second
+
+    def test_dictionary_lookup(self):
+        counts = {CanonicalURI.from_string("http://a/b/../c"): 1}
+        assert counts[CanonicalURI.from_string("HTTP://A/c")] == 1
+
+    def test_compares_to_plain_references(self):
+        uri = CanonicalURI.from_string("HTTP://A/c")
+        assert uri == URIReference.from_string("http://a/c")
+
+    def test_compares_to_strings_and_tuples(self):
+        uri = CanonicalURI.from_string("HTTP://A/c")
+        assert uri == "http://a/c"
+        assert uri == ("http", "a", "/c", None, None)
+        assert uri != "http://a/d"
+
+    def test_copies_keep_the_type(self):
+        uri = CanonicalURI.from_string("http://a/b")
+        assert type(uri.copy_with(path="/c")) is CanonicalURI
+
+    def test_exported(self):
+        assert rfc3986.CanonicalURI is CanonicalURI
+
+
+class TestURIReferenceComparesToStringsQuickly:
+    def test_own_string_is_not_parsed_again(
+        self, monkeypatch, uri_with_everything
+    ):
+        uri = URIReference.from_string(uri_with_everything)
+        assert uri == uri_with_everything
+
+        monkeypatch.setattr(
+            URIReference,
+            "_from_string",
+            lambda *args: pytest.fail("string was parsed again"),
+        )
+        assert uri == uri_with_everything
+        assert uri == uri.normalize().unsplit()
+
+    def test_normalized_string(self):
+        uri = URIReference.from_string("HTTP://Example.com/a/../%7e")
+        assert uri == "http://example.com/%7E"
+        assert set(uri._equal_strings()) == {
+            "HTTP://Example.com/a/../%7e",
+            "http://example.com/%7E",
+        }
+
+    def test_other_strings_are_still_parsed(self):
+        uri = URIReference.from_string("http://example.com/a")
+        assert uri == "HTTP://EXAMPLE.COM/b/../a"
+        assert (uri == "http://example.com/b") is False
+
+    def test_strings_that_do_not_round_trip(self):
+        uri = URIReference(None, None, "//a", None, None)
+        assert uri.unsplit() == "//a"
+        assert uri._equal_strings() == ()
+        assert (uri == "//a") is False
+
+
+class TestURIReferenceMemoisesUnsplit:
+    def test_unsplit_is_remembered(self, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything)
+        assert uri.unsplit() is uri.unsplit()
+        assert uri.unsplit() == uri_with_everything
+
+    def test_parsing_does_not_store_the_string(self, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything)
+        assert "_cached_unsplit" not in vars(uri)
+
+    def test_copies_are_unsplit_again(self):
+        uri = URIReference.from_string("http://a/b")
+        uri.unsplit()
+        assert uri.copy_with(path="/c").unsplit() == "http://a/c"
+
+    def test_unsplit_is_not_pickled(self, uri_with_everything):
+        uri = URIReference.from_string(uri_with_everything)
+        uri.unsplit()
+        copy = pickle.loads(pickle.dumps(uri))
+        assert "_cached_unsplit" not in vars(copy)
+        assert copy.unsplit() == uri.unsplit()